@@ -194,12 +194,12 @@ def _build_deployments_df(
     """
     import pandas as pd
     # Import HELM registries
-    from helm.benchmark import config_registry
     from helm.benchmark import model_deployment_registry
+    from magnet.backends.helm.util.helm_registry import ensure_builtin_configs_registered
 
-    # NOTE: This is NOT idempotent, which means that this is not safe to call
-    # from CI.
-    config_registry.register_builtin_configs_from_helm_package()
+    # NOTE: HELM's registration is NOT idempotent, so we guard it to only
+    # happen once per process.
+    ensure_builtin_configs_registered()
 
     rows = []
     for dep in model_deployment_registry.ALL_MODEL_DEPLOYMENTS:
@@ -134,6 +134,7 @@ NOTES
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import time
 import shutil
@@ -148,11 +149,6 @@ import sys
 
 from loguru import logger
 
-# We rely on MAGNET's HELM output exploration helpers.
-# These are already present in aiq-magnet and know how to load / validate
-# the standard json files produced by helm-run.
-from magnet.backends.helm.helm_outputs import HelmOutputs
-
 
 def _normalize_optional_pathish(value):
     """
@@ -1196,6 +1192,10 @@ def find_best_precomputed_run(
         ...     )
         ...     assert result3 is None
     """
+    # We rely on MAGNET's HELM output exploration helpers, which know how to
+    # load / validate the standard json files produced by helm-run. These
+    # import HELM, so we defer them until we actually need to search.
+    from magnet.backends.helm.helm_outputs import HelmOutputs
     candidates: list[MatchResult] = []
 
     # TODO: if we can resolve the exact directory name we can avoid O(N) search
@@ -1398,6 +1398,19 @@ def write_helm_log_config(out_dpath: Path) -> Path:
     return config_fpath
 
 
+def _require_helm() -> None:
+    """
+    Fail fast with a clear message if HELM is not installed.
+
+    Uses :func:`importlib.util.find_spec` so the check does not execute any
+    of HELM's (expensive) module level code.
+    """
+    if importlib.util.find_spec('helm') is None:
+        raise ImportError(
+            'HELM is required to materialize runs, but the "helm" package '
+            'is not installed. Install crfm-helm to provide helm-run.')
+
+
 def run_helm(
     requested_desc: str,
     suite: str,
@@ -1414,6 +1427,7 @@ def run_helm(
 
     We do not run helm-summarize by design.
     """
+    _require_helm()
     cmd = [
         'helm-run',
         '--run-entries',
@@ -1485,6 +1499,7 @@ def find_run_in_out_dpath(
 
     and choose the best token-subset match.
     """
+    from magnet.backends.helm.helm_outputs import HelmOutputs
     bo = out_dpath / 'benchmark_output'
     if not bo.exists():
         return None
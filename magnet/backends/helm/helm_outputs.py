@@ -3,16 +3,21 @@ Object oriented classes to represent, load, and explore the outputs of helm
 benchmarks.
 """
 from __future__ import annotations
+import fnmatch
+import mmap
 import os
+import re
 import ubelt as ub
 import pandas as pd
 import kwutil
-import dacite
+import msgspec
 
 from helm.benchmark.adaptation.scenario_state import ScenarioState
 from helm.benchmark.run_spec import RunSpec
 from helm.benchmark.metrics.statistic import Stat
 from helm.benchmark.metrics.metric import PerInstanceStats
+from helm.benchmark.metrics.metric_name import MetricName
+from helm.benchmark.augmentations.perturbation_description import PerturbationDescription
 
 from typing import Generator
 
@@ -24,7 +29,8 @@ except ImportError:
 from magnet.utils import util_pandas
 from magnet.utils import util_msgspec
 from magnet.utils.util_iterable import add_length_hint
-from functools import cached_property
+from magnet.utils.util_dataclass import dataclass_from_dict_factory
+from functools import cached_property, lru_cache
 
 # Pre-register msgspec structure variants of the HELM dataclass types
 ScenarioStateStruct = util_msgspec.MSGSPEC_REGISTRY.register(ScenarioState, dict=True)
@@ -33,6 +39,97 @@ StatStruct = util_msgspec.MSGSPEC_REGISTRY.register(Stat)
 PerInstanceStatsStruct = util_msgspec.MSGSPEC_REGISTRY.register(PerInstanceStats)
 
 
+# Narrow views of the HELM files that only decode what summaries need;
+# msgspec skips every other field without building it.
+class _AdapterSpecLite(msgspec.Struct):
+    num_outputs: int = 5
+    num_trials: int = 1
+    num_train_trials: int = 1
+
+
+class _ScenarioStateLite(msgspec.Struct):
+    adapter_spec: _AdapterSpecLite
+
+
+class _RunSpecLite(msgspec.Struct):
+    metric_specs: list[msgspec.Raw] = []
+
+
+# The json files helm-run writes into every completed run directory
+_REQUIRED_RUN_FILES = frozenset({
+    'run_spec.json',
+    'scenario.json',
+    'scenario_state.json',
+    'per_instance_stats.json',
+    'stats.json',
+})
+
+
+# Tables available for each run (the names of the loader methods)
+_TABLE_KEYS = ('per_instance_stats', 'run_spec', 'scenario_state', 'stats')
+
+
+def _as_path(path):
+    """
+    Return ``path`` as a :class:`ub.Path`, reusing it if it already is one.
+    """
+    return path if isinstance(path, ub.Path) else ub.Path(path)
+
+
+@lru_cache(maxsize=128)
+def _compiled_glob(pattern):
+    # Directory scans filter every entry with the same few patterns
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _scan_dirs(root, pattern='*'):
+    """
+    Yield the subdirectories of ``root`` whose names match a glob pattern.
+
+    This is like ``[p for p in root.glob(pattern) if p.is_dir()]``, but uses
+    a single :func:`os.scandir` call, whose entries usually know their type
+    without an extra stat. Patterns containing a path separator are passed
+    to :meth:`Path.glob`.
+
+    Args:
+        root (str | PathLike): directory to scan
+        pattern (str): glob pattern for the names of the subdirectories
+
+    Yields:
+        ub.Path
+
+    Example:
+        >>> from magnet.backends.helm.helm_outputs import _scan_dirs
+        >>> root = ub.Path.appdir('magnet/tests/scan_dirs').delete().ensuredir()
+        >>> (root / 'a1').ensuredir()
+        >>> (root / 'b1').ensuredir()
+        >>> (root / '.hidden').ensuredir()
+        >>> (root / 'a2.txt').touch()
+        >>> sorted(p.name for p in _scan_dirs(root))
+        ['.hidden', 'a1', 'b1']
+        >>> assert sorted(_scan_dirs(root)) == sorted(p for p in root.glob('*') if p.is_dir())
+        >>> sorted(p.name for p in _scan_dirs(root, 'a*'))
+        ['a1']
+        >>> list(_scan_dirs(root / 'does-not-exist'))
+        []
+    """
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        for path in ub.Path(root).glob(pattern):
+            if path.is_dir():
+                yield path
+        return
+    # Like Path.glob, wildcards also match hidden names
+    match = _compiled_glob(pattern)
+    try:
+        entries = os.scandir(root)
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    with entries:
+        for entry in entries:
+            if match(entry.name) and entry.is_dir():
+                yield ub.Path(entry.path)
+
+
 class HelmOutputs(ub.NiceRepr):
     """
     Class to represent and explore helm outputs
@@ -169,26 +266,44 @@ class HelmOutputs(ub.NiceRepr):
             >>> result3 = HelmOutputs._coerce_input_path(root / 'benchmark_output/runs')
             >>> assert result1 == result2 == result3
         """
-        path = ub.Path(path)
-        if path.name == 'benchmark_output':
-            return path
-        elif path.parts[-2:] == ('benchmark_output', 'runs'):
-            return path.parent
-        else:
-            candidate = path / 'benchmark_output'
-            if candidate.exists():
-                return candidate
-            else:
-                raise FileNotFoundError("Unable to find a directory that looks like HELM outputs")
+        root_dir = cls._find_helm_outputs_dir(path)
+        if root_dir is None:
+            raise FileNotFoundError("Unable to find a directory that looks like HELM outputs")
+        return ub.Path(root_dir)
 
     @classmethod
     def _is_likely_a_helm_outputs_path(self, path):
-        try:
-            HelmOutputs._coerce_input_path(path)
-        except FileNotFoundError:
-            return False
+        """
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> assert HelmOutputs._is_likely_a_helm_outputs_path('/data/benchmark_output')
+            >>> assert HelmOutputs._is_likely_a_helm_outputs_path(ub.Path('/data/benchmark_output/runs/'))
+            >>> assert not HelmOutputs._is_likely_a_helm_outputs_path('/does/not/exist/runs')
+            >>> dpath = ub.Path.appdir('magnet/tests/helm_outputs_path').ensuredir()
+            >>> (dpath / 'benchmark_output').ensuredir()
+            >>> assert HelmOutputs._is_likely_a_helm_outputs_path(dpath)
+        """
+        return HelmOutputs._find_helm_outputs_dir(path) is not None
+
+    @staticmethod
+    def _find_helm_outputs_dir(path):
+        """
+        Resolve ``path`` to its ``benchmark_output`` directory as a string, or
+        None if it does not look like HELM outputs. The common cases are
+        decided from the path string alone; only a bare prefix costs a stat.
+        """
+        path = os.fspath(path)
+        stripped = path.rstrip(os.sep) or path
+        parent, name = os.path.split(stripped)
+        if name == 'benchmark_output':
+            return stripped
+        elif name == 'runs' and os.path.basename(parent) == 'benchmark_output':
+            return parent
         else:
-            return True
+            candidate = os.path.join(path, 'benchmark_output')
+            if os.path.exists(candidate):
+                return candidate
+            return None
 
     def write_directory_report(self):
         """
@@ -204,15 +319,18 @@ class HelmOutputs(ub.NiceRepr):
     def summarize(self):
         # TODO: what is the most useful summary information we can quickly get?
         summary = {}
-        suites = self.suites()
+        decode = util_msgspec.MSGSPEC_REGISTRY.decode
         rows = []
+        suites = self.iter_suites()
+        num_suites = len(suites)
         for suite in suites:
-            runs = suite.runs()
-            for run in runs:
-                n_stats = len(run.msgspec.stats())
-                n_perinstance = len(run.msgspec.per_instance_stats())
-                run_spec = run.msgspec.run_spec()
-                adapter_spec = run.msgspec.scenario_state().adapter_spec
+            for run in suite.iter_runs():
+                # Only counts and a few scalars are needed, so avoid
+                # decoding the full records.
+                n_stats = run.json.stats_count()
+                n_perinstance = run.json.per_instance_stats_count()
+                run_spec = decode((run.path / 'run_spec.json').read_bytes(), _RunSpecLite)
+                adapter_spec = decode((run.path / 'scenario_state.json').read_bytes(), _ScenarioStateLite).adapter_spec
                 rows.append({
                     'name': run.path.name,
                     'n_stats': n_stats,
@@ -224,9 +342,11 @@ class HelmOutputs(ub.NiceRepr):
                 })
 
         df = pd.DataFrame(rows)
-        stats = df.describe().loc[['count', 'mean', 'std']]
-        summary['num_suites'] = len(self._suite_dirs())
-        summary['num_run_specs'] = len(self.list_run_specs())
+        # Only these three of the describe() statistics are reported
+        stats = df.drop(columns='name').agg(['count', 'mean', 'std']).astype(float)
+        # Reuse the directories scanned above instead of listing them again
+        summary['num_suites'] = num_suites
+        summary['num_run_specs'] = len(set(df['name']))
         summary['stats'] = stats
         return summary
 
@@ -250,11 +370,30 @@ class HelmOutputs(ub.NiceRepr):
         # also not overcomplicate it.
         return [HelmSuite(p) for p in self._suite_dirs(pattern)]
 
+    def iter_suites(self, pattern='*') -> Generator[HelmSuite, None, None]:
+        """
+        Lazily yield the suites in sorted order.
+
+        The suite directories are listed up front (a single directory scan),
+        but :class:`HelmSuite` objects are only built as they are consumed.
+        The result reports its length via :func:`len`.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmOutputs.demo()
+            >>> suites = self.iter_suites()
+            >>> assert len(suites) == len(self.suites())
+            >>> assert next(suites).path == self.suites()[0].path
+        """
+        suite_dirs = self._suite_dirs(pattern)
+        suites = (HelmSuite(p) for p in suite_dirs)
+        return add_length_hint(suites, len(suite_dirs), known_length=True)
+
     def _suite_dirs(self, pattern='*'):
         # not robust to extra directories being written.  is there a way to
         # determine that these directories are actually suites?
         # TODO: no longer need to handle latest.
-        return [p for p in sorted((self.root_dir / 'runs').glob(pattern)) if p.is_dir() and p.name != 'latest']
+        return sorted(p for p in _scan_dirs(self.root_dir / 'runs', pattern) if p.name != 'latest')
 
     def list_suites(self):
         # maybe remove
@@ -264,7 +403,12 @@ class HelmOutputs(ub.NiceRepr):
         # maybe remove
         # not robust to extra directories being written.  is there a way to
         # determine that these directories are actually run specs?
-        run_spec_names = [p.name for p in (self.root_dir / 'runs').glob(suite + '/*') if p.is_dir() if ':' in p.name]
+        run_spec_names = [
+            p.name
+            for suite_dir in _scan_dirs(self.root_dir / 'runs', suite)
+            for p in _scan_dirs(suite_dir)
+            if ':' in p.name
+        ]
         run_spec_names = sorted(set(run_spec_names))
         return run_spec_names
 
@@ -283,7 +427,7 @@ class HelmSuite(ub.NiceRepr):
         <HelmRuns(4)>
     """
     def __init__(self, path):
-        self.path = ub.Path(path)
+        self.path = _as_path(path)
         self.name = self.path.name
 
     def __nice__(self):
@@ -325,20 +469,47 @@ class HelmSuite(ub.NiceRepr):
 
     @classmethod
     def _is_likely_a_suite_path(self, path):
+        """
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> assert HelmSuite._is_likely_a_suite_path('/data/benchmark_output/runs/my-suite')
+            >>> assert HelmSuite._is_likely_a_suite_path(ub.Path('benchmark_output/runs/my-suite/'))
+            >>> assert not HelmSuite._is_likely_a_suite_path('/data/benchmark_output/runs')
+            >>> assert not HelmSuite._is_likely_a_suite_path('/data/other_output/runs/my-suite')
+        """
         # Helm suites are typically have benchmark_output/runs as their parent
         # Might not always be robust, but should often work
-        return path.parts[-3:-1] == ('benchmark_output', 'runs')
+        # (string operations avoid splitting the whole path into parts)
+        parent = os.path.dirname(os.fspath(path).rstrip(os.sep))
+        grandparent, parent_name = os.path.split(parent)
+        return (parent_name == 'runs' and
+                os.path.basename(grandparent) == 'benchmark_output')
 
     def _run_dirs(self, pattern='*'):
         # not robust to extra directories being written.  is there a way to
         # determine that these directories are actually run specs?
-        return sorted([p for p in (self.path).glob(pattern) if p.is_dir() if ':' in p.name])
+        return sorted([p for p in _scan_dirs(self.path, pattern) if ':' in p.name])
 
     def runs(self, pattern='*') -> HelmRuns:
         paths = self._run_dirs(pattern)
         return HelmRuns(paths)
         # return [HelmRun(p) for p in self._run_dirs(pattern)]
 
+    def iter_runs(self, pattern='*') -> Generator[HelmRun, None, None]:
+        """
+        Lazily yield the runs in this suite in sorted order.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmSuite.demo()
+            >>> runs = self.iter_runs()
+            >>> assert len(runs) == len(self.runs())
+            >>> assert next(runs).path == self.runs()[0].path
+        """
+        run_dirs = self._run_dirs(pattern)
+        runs = (HelmRun(p) for p in run_dirs)
+        return add_length_hint(runs, len(run_dirs), known_length=True)
+
 
 class HelmSuites(ub.NiceRepr):
     """
@@ -389,7 +560,7 @@ class HelmSuites(ub.NiceRepr):
         """
         Filter to only existing suite directories
         """
-        return self.__class__([p for p in self.paths if ub.Path(p).is_dir()])
+        return self.__class__([p for p in self.paths if os.path.isdir(p)])
 
     @classmethod
     def coerce(cls, input) -> Self:
@@ -496,7 +667,7 @@ class HelmSuites(ub.NiceRepr):
             # unsure what the right answer is.
             # NOTE: latest was removed in
             # https://github.com/stanford-crfm/helm/pull/3984
-            path = ub.Path(path)
+            path = _as_path(path)
             if HelmSuite._is_likely_a_suite_path(path):
                 suite_paths.append(path)
             else:
@@ -572,17 +743,25 @@ class HelmRuns(ub.NiceRepr):
     def existing(self):
         """
         Filter to only existing runs
-        """
-        return self.__class__([
-            p for p in self.paths
-            if all(p.exists() for p in [
-                p / 'run_spec.json',
-                p / 'scenario.json',
-                p / 'scenario_state.json',
-                p / 'per_instance_stats.json',
-                p / 'stats.json',
-            ])
-        ])
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRuns.demo()
+            >>> missing = self.paths[0].parent / 'does-not-exist'
+            >>> runs = HelmRuns(self.paths + [missing])
+            >>> assert runs.existing().paths == self.paths
+        """
+        # One directory listing per run instead of a stat call per file
+        existing_paths = []
+        for p in self.paths:
+            try:
+                with os.scandir(p) as entries:
+                    names = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if _REQUIRED_RUN_FILES.issubset(names):
+                existing_paths.append(p)
+        return self.__class__(existing_paths)
 
     @classmethod
     def coerce(cls, input) -> Self:
@@ -691,24 +870,142 @@ class HelmRuns(ub.NiceRepr):
         for index in range(len(self)):
             yield self[index]
 
-    def per_instance_stats(self) -> util_pandas.DotDictDataFrame:
-        # Could likely be quite a bit more efficient here
-        table = pd.concat([r.dataframe.per_instance_stats() for r in self], axis=0)
-        return table
+    def per_instance_stats(self, workers=0, cache=False) -> util_pandas.DotDictDataFrame:
+        """
+        Args:
+            workers (int): if positive, load runs with this many threads
+            cache (bool): if True, reuse a table cached on disk
+        """
+        return self._cached_table('per_instance_stats', workers, cache)
 
-    def run_spec(self) -> util_pandas.DotDictDataFrame:
-        # Could likely be quite a bit more efficient here
-        table = pd.concat([r.dataframe.run_spec() for r in self], axis=0)
-        return table
+    def run_spec(self, workers=0, cache=False) -> util_pandas.DotDictDataFrame:
+        """
+        Args:
+            workers (int): if positive, load runs with this many threads
+            cache (bool): if True, reuse a table cached on disk
+        """
+        return self._cached_table('run_spec', workers, cache)
 
-    def scenario_state(self) -> util_pandas.DotDictDataFrame:
-        # Could likely be quite a bit more efficient here
-        table = pd.concat([r.dataframe.scenario_state() for r in self], axis=0)
+    def scenario_state(self, workers=0, cache=False) -> util_pandas.DotDictDataFrame:
+        """
+        Args:
+            workers (int): if positive, load runs with this many threads
+            cache (bool): if True, reuse a table cached on disk
+        """
+        return self._cached_table('scenario_state', workers, cache)
+
+    def stats(self, workers=0, cache=False) -> util_pandas.DotDictDataFrame:
+        """
+        Args:
+            workers (int): if positive, load runs with this many threads
+            cache (bool): if True, reuse a table cached on disk
+        """
+        return self._cached_table('stats', workers, cache)
+
+    def _cached_table(self, key, workers=0, cache=False):
+        """
+        Like :meth:`_build_table`, but optionally cached on disk.
+
+        The cache is keyed on the run paths and the modification times of
+        the files each table is built from, so rewriting a run invalidates
+        it.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRuns.demo()
+            >>> cacher = self._table_cacher('stats')
+            >>> cacher.clear()
+            >>> cold = self._cached_table('stats', cache=True)
+            >>> assert cacher.exists()
+            >>> warm = self._cached_table('stats', cache=True)
+            >>> assert cold.equals(warm)
+            >>> assert warm.equals(self._build_table('stats'))
+            >>> cacher.clear()
+        """
+        if not cache:
+            return self._build_table(key, workers)
+        cacher = self._table_cacher(key)
+        table = cacher.tryload(on_error='clear')
+        if table is None:
+            table = self._build_table(key, workers)
+            cacher.save(table)
         return table
 
-    def stats(self) -> util_pandas.DotDictDataFrame:
-        # Could likely be quite a bit more efficient here
-        table = pd.concat([r.dataframe.stats() for r in self], axis=0)
+    def _table_cacher(self, key):
+        # Every table except run_spec also reads run_spec.json for the name
+        fnames = sorted({'run_spec.json', f'{key}.json'})
+        stamps = [
+            (os.fspath(p), [os.stat(os.path.join(p, fname)).st_mtime_ns
+                            for fname in fnames])
+            for p in self.paths
+        ]
+        depends = ub.hash_data([key, stamps])
+        dpath = ub.Path.appdir('magnet', 'helm_tables', type='cache')
+        return ub.Cacher(f'helm_{key}', depends=depends, dpath=dpath, verbose=0)
+
+    def _build_table(self, key, workers=0):
+        """
+        Build one table of the ``key`` rows from every run, in run order.
+
+        The flat rows from all runs are collected first and turned into a
+        single DataFrame, instead of concatenating one DataFrame per run.
+        Each run reads several json files, so threads can overlap the file
+        reads and parsing of different runs.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRuns.demo()
+            >>> serial = self._build_table('stats')
+            >>> threaded = self._build_table('stats', workers=2)
+            >>> assert serial.equals(threaded)
+            >>> stacked = pd.concat([r.stats() for r in self], ignore_index=True)
+            >>> assert serial.equals(stacked)
+        """
+        workers = min(workers, len(self))
+        mode = 'thread' if workers > 0 else 'serial'
+        with ub.Executor(mode=mode, max_workers=workers) as executor:
+            jobs = [executor.submit(getattr(r.dataframe, f'_{key}_rows'))
+                    for r in self]
+            rows = [row for job in jobs for row in job.result()]
+        return self._rows_to_table(key, rows)
+
+    def aggregate_all(self, workers=0) -> dict[str, util_pandas.DotDictDataFrame]:
+        """
+        Build the per_instance_stats, run_spec, scenario_state, and stats
+        tables together, visiting each run once.
+
+        Args:
+            workers (int): if positive, load runs with this many threads
+
+        Returns:
+            Dict[str, DotDictDataFrame]: the tables keyed by method name
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRuns.demo()
+            >>> tables = self.aggregate_all()
+            >>> for key, table in tables.items():
+            ...     assert table.equals(getattr(self, key)()), key
+        """
+        workers = min(workers, len(self))
+        mode = 'thread' if workers > 0 else 'serial'
+        accum = {key: [] for key in _TABLE_KEYS}
+        with ub.Executor(mode=mode, max_workers=workers) as executor:
+            jobs = [executor.submit(r.dataframe._all_rows) for r in self]
+            for job in jobs:
+                for key, rows in job.result().items():
+                    accum[key].extend(rows)
+        tables = {key: self._rows_to_table(key, rows)
+                  for key, rows in accum.items()}
+        return tables
+
+    @staticmethod
+    def _rows_to_table(key, rows):
+        if key == 'run_spec':
+            # run_spec rows carry their own name column and keep their order
+            table = util_pandas.DotDictDataFrame(rows)
+        else:
+            table = _HelmRunDataFrameView._table(rows)
         return table
 
 ### --- Helm Run View Backends
@@ -792,6 +1089,33 @@ class _HelmRunJsonView:
         """
         return kwutil.Json.load(self.parent.path / 'stats.json', backend=self.backend)
 
+    def per_instance_stats_count(self) -> int:
+        """
+        Number of items in per_instance_stats.json, without decoding them.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRun.demo().json
+            >>> assert self.per_instance_stats_count() == len(self.per_instance_stats())
+        """
+        return self._count_items('per_instance_stats.json')
+
+    def stats_count(self) -> int:
+        """
+        Number of items in stats.json, without decoding them.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRun.demo().json
+            >>> assert self.stats_count() == len(self.stats())
+        """
+        return self._count_items('stats.json')
+
+    def _count_items(self, fname):
+        # Raw items are validated as json but never built into objects
+        data = (self.parent.path / fname).read_bytes()
+        return len(util_msgspec.MSGSPEC_REGISTRY.decode(data, list[msgspec.Raw]))
+
 
 class _HelmRunDataclassView:
     """
@@ -819,49 +1143,24 @@ class _HelmRunDataclassView:
         which contains the statistics produced for the metrics for each
         instance (i.e. input).
         """
-        from helm.benchmark.augmentations.perturbation_description import PerturbationDescription
-        from helm.benchmark.metrics.metric_name import MetricName
-        nested_items = self.parent.json.per_instance_stats()
-        USE_DACITE = 0
-        # nested_items = kwutil.Json.load(self.path / 'per_instance_stats.json', backend='ujson')
+        structs = self.parent.msgspec.per_instance_stats()
 
         def _gen_per_instance_stats():
-            if USE_DACITE:
-                DACITE_CONFIG = dacite.Config(
-                    check_types=False,
-                    type_hooks={
-                        MetricName: lambda d: MetricName(**d),
-                        PerturbationDescription: lambda d: PerturbationDescription(**ub.udict.intersection(d, PerturbationDescription.__dataclass_fields__.keys()))
-                    }
+            # The same few metric names repeat for every instance, so share
+            # one (frozen) name object per distinct value.
+            cache = {}
+            for item in structs:
+                perturbation = item.perturbation
+                if perturbation is not None:
+                    perturbation = _perturbation_from_struct(perturbation, cache)
+                yield PerInstanceStats(
+                    instance_id=item.instance_id,
+                    perturbation=perturbation,
+                    train_trial_index=item.train_trial_index,
+                    stats=[_stat_from_struct(stat, cache) for stat in item.stats],
                 )
-                # dacite seems to have a lot of overhead
-                for item in nested_items:
-                    instance = dacite.from_dict(PerInstanceStats, item, config=DACITE_CONFIG)
-                    yield instance
-            else:
-                for item in nested_items:
-                    # Alternative faster loading, using knowledge about the what
-                    # the dataclass structure is this is not robust to changes in
-                    # HELM.
-                    stats_objs = []
-                    for stat in item['stats']:
-                        name = stat['name']
-                        if 'perturbation' in name:
-                            name['perturbation'] = PerturbationDescription(name['perturbation'])
-                        name = MetricName(**name)
-                        stat['name'] = name
-                        stat_obj = Stat(**stat)
-                        stats_objs.append(stat_obj)
-                    item['stats'] = stats_objs
-                    perturbation = item.get('perturbation', None)
-                    if perturbation is not None:
-                        perturbation = ub.udict.intersection(perturbation, PerturbationDescription.__dataclass_fields__.keys())
-                        perturbation = PerturbationDescription(**perturbation)
-                    item['perturbation'] = perturbation
-                    instance = PerInstanceStats(**item)
-                    yield instance
-
-        return add_length_hint(_gen_per_instance_stats(), len(nested_items), known_length=True)
+
+        return add_length_hint(_gen_per_instance_stats(), len(structs), known_length=True)
 
     def run_spec(self) -> RunSpec:
         """
@@ -869,7 +1168,7 @@ class _HelmRunDataclassView:
         adapter and metrics for the run.
         """
         nested = self.parent.json.run_spec()
-        run_spec = dacite.from_dict(RunSpec, nested)
+        run_spec = dataclass_from_dict_factory(RunSpec)(nested)
         return run_spec
 
     def scenario(self):
@@ -891,7 +1190,7 @@ class _HelmRunDataclassView:
         every request to and response from the model.
         """
         nested = self.parent.json.scenario_state()
-        state = dacite.from_dict(ScenarioState, nested)
+        state = dataclass_from_dict_factory(ScenarioState)(nested)
         return state
 
     def stats(self) -> Generator[Stat, None, None]:
@@ -900,12 +1199,123 @@ class _HelmRunDataclassView:
         contains the statistics produced for the metrics, aggregated across all
         instances (i.e. inputs).
         """
-        stats_list = self.parent.json.stats()
-        stats = (dacite.from_dict(Stat, json_stat) for json_stat in stats_list)
-        stats = add_length_hint(stats, len(stats_list), known_length=True)
+        structs = self.parent.msgspec.stats()
+        cache = {}
+        stats = (_stat_from_struct(stat, cache) for stat in structs)
+        stats = add_length_hint(stats, len(structs), known_length=True)
         return stats
 
 
+def _perturbation_from_struct(struct, cache=None) -> PerturbationDescription:
+    if cache is None:
+        return PerturbationDescription(**msgspec.structs.asdict(struct))
+    key = (PerturbationDescription, msgspec.structs.astuple(struct))
+    perturbation = cache.get(key, None)
+    if perturbation is None:
+        perturbation = PerturbationDescription(**msgspec.structs.asdict(struct))
+        cache[key] = perturbation
+    return perturbation
+
+
+def _metric_name_from_struct(struct, cache=None) -> MetricName:
+    perturbation = struct.perturbation
+    if cache is not None:
+        perturbation_key = None if perturbation is None else msgspec.structs.astuple(perturbation)
+        key = (MetricName, struct.name, struct.split, struct.sub_split, perturbation_key)
+        metric_name = cache.get(key, None)
+        if metric_name is not None:
+            return metric_name
+    if perturbation is not None:
+        perturbation = _perturbation_from_struct(perturbation, cache)
+    metric_name = MetricName(
+        name=struct.name,
+        split=struct.split,
+        sub_split=struct.sub_split,
+        perturbation=perturbation,
+    )
+    if cache is not None:
+        cache[key] = metric_name
+    return metric_name
+
+
+def _stat_from_struct(struct, cache=None) -> Stat:
+    """
+    Build a HELM :class:`Stat` dataclass from its msgspec struct variant by
+    reading attributes directly, which avoids dacite's per-field type
+    introspection.
+
+    Args:
+        struct (StatStruct): the decoded stat
+        cache (dict | None): if given, equal metric names and perturbation
+            descriptions are looked up here and shared between stats (they
+            are frozen dataclasses) instead of being rebuilt for every stat.
+
+    Example:
+        >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+        >>> from magnet.backends.helm.helm_outputs import _stat_from_struct
+        >>> text = b'{"name": {"name": "exact_match", "split": "test", "perturbation": {"name": "typos", "robustness": true}}, "count": 1, "sum": 1.0, "sum_squared": 1.0}'
+        >>> struct = util_msgspec.MSGSPEC_REGISTRY.decode(text, StatStruct)
+        >>> cache = {}
+        >>> stat1 = _stat_from_struct(struct, cache)
+        >>> stat2 = _stat_from_struct(struct, cache)
+        >>> stat1.name.perturbation.name, stat1.name.perturbation.robustness
+        ('typos', True)
+        >>> assert stat1 is not stat2 and stat1.name is stat2.name
+        >>> assert _stat_from_struct(struct) == stat1
+    """
+    return Stat(
+        name=_metric_name_from_struct(struct.name, cache),
+        count=struct.count,
+        sum=struct.sum,
+        sum_squared=struct.sum_squared,
+        min=struct.min,
+        max=struct.max,
+        mean=struct.mean,
+        variance=struct.variance,
+        stddev=struct.stddev,
+    )
+
+
+# Below this size a plain read is cheaper than setting up a memory map
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _decode_json_file(fpath, cls):
+    """
+    Decode a json file into ``cls`` with the shared msgspec registry.
+
+    Large files are decoded directly from a read-only memory map, which
+    avoids copying the whole file into a bytes object first. Only use
+    this when the decoded type does not keep references into the input
+    buffer (e.g. it must not contain :class:`msgspec.Raw`).
+
+    Example:
+        >>> from magnet.backends.helm.helm_outputs import _decode_json_file
+        >>> import json
+        >>> dpath = ub.Path.appdir('magnet/tests/decode_json').ensuredir()
+        >>> small = dpath / 'small.json'
+        >>> large = dpath / 'large.json'
+        >>> small.write_text(json.dumps([1, 2, 3]))
+        >>> large.write_text(json.dumps(list(range(100_000))))
+        >>> _decode_json_file(small, list[int])
+        [1, 2, 3]
+        >>> assert _decode_json_file(large, list[int]) == list(range(100_000))
+    """
+    registry = util_msgspec.MSGSPEC_REGISTRY
+    with open(fpath, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size < _MMAP_MIN_BYTES:
+            return registry.decode(file.read(), cls)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return registry.decode(buffer, cls)
+
+
+def _msgpack_cache_enabled():
+    # Opt-in because it writes sidecar files into the HELM run directories
+    value = os.environ.get('MAGNET_MSGPACK_CACHE', '')
+    return value.strip().lower() in {'1', 'true', 'yes', 'on'}
+
+
 class _HelmRunMsgspecView:
     """
     A view of a single HelmRun that will return MsgSpec structures from its
@@ -927,14 +1337,64 @@ class _HelmRunMsgspecView:
     def __init__(self, parent: HelmRun):
         self.parent = parent
 
+    def _decode(self, fname, cls):
+        """
+        Decode a json file in the run directory into ``cls``.
+
+        If the ``MAGNET_MSGPACK_CACHE`` environment variable is truthy, the
+        result is also written to a msgpack sidecar in ``.msgpack_cache``,
+        which is much faster to decode and is preferred while it is newer
+        than the json file.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> import os
+            >>> self = HelmRun.demo().msgspec
+            >>> expected = self.stats()
+            >>> cache_dpath = self.parent.path / '.msgpack_cache'
+            >>> os.environ['MAGNET_MSGPACK_CACHE'] = '1'
+            >>> try:
+            >>>     cold = self.stats()
+            >>>     assert (cache_dpath / 'stats.msgpack').exists()
+            >>>     warm = self.stats()
+            >>> finally:
+            >>>     del os.environ['MAGNET_MSGPACK_CACHE']
+            >>>     cache_dpath.delete()
+            >>> assert cold == warm == expected
+        """
+        json_fpath = self.parent.path / fname
+        registry = util_msgspec.MSGSPEC_REGISTRY
+        if not _msgpack_cache_enabled():
+            return _decode_json_file(json_fpath, cls)
+
+        cache_fpath = self.parent.path / '.msgpack_cache' / (json_fpath.stem + '.msgpack')
+        json_mtime = os.stat(json_fpath).st_mtime_ns
+        try:
+            cache_mtime = os.stat(cache_fpath).st_mtime_ns
+        except FileNotFoundError:
+            cache_mtime = None
+        if cache_mtime is not None and cache_mtime >= json_mtime:
+            return registry.decode_msgpack(cache_fpath.read_bytes(), cls)
+
+        obj = _decode_json_file(json_fpath, cls)
+        try:
+            cache_fpath.parent.ensuredir()
+            # Write then rename so readers never see a partial sidecar
+            tmp_fpath = cache_fpath.augment(tail=f'.tmp{os.getpid()}')
+            tmp_fpath.write_bytes(msgspec.msgpack.encode(obj))
+            os.replace(tmp_fpath, cache_fpath)
+        except OSError:
+            # The run directory may be read-only; the cache is best effort.
+            pass
+        return obj
+
     def per_instance_stats(self) -> list[PerInstanceStatsStruct]:
         """
         per_instance_stats.json contains a serialized list of PerInstanceStats,
         which contains the statistics produced for the metrics for each
         instance (i.e. input).
         """
-        data = (self.parent.path / 'per_instance_stats.json').read_bytes()
-        obj = util_msgspec.MSGSPEC_REGISTRY.decode(data, list[PerInstanceStatsStruct])
+        obj = self._decode('per_instance_stats.json', list[PerInstanceStatsStruct])
         return obj
 
     def run_spec(self) -> RunSpecStruct:
@@ -942,8 +1402,7 @@ class _HelmRunMsgspecView:
         run_spec.json contains the RunSpec, which specifies the scenario,
         adapter and metrics for the run.
         """
-        data = (self.parent.path / 'run_spec.json').read_bytes()
-        obj = util_msgspec.MSGSPEC_REGISTRY.decode(data, RunSpecStruct)
+        obj = self._decode('run_spec.json', RunSpecStruct)
         return obj
 
     def scenario(self):
@@ -978,9 +1437,7 @@ class _HelmRunMsgspecView:
             >>> state2 = run.dataclass.scenario_state()
             >>> assert state1.__annotations__.keys() == state2.__annotations__.keys()
         """
-        from magnet.utils import util_msgspec
-        data = (self.parent.path / 'scenario_state.json').read_bytes()
-        obj = util_msgspec.MSGSPEC_REGISTRY.decode(data, ScenarioStateStruct)
+        obj = self._decode('scenario_state.json', ScenarioStateStruct)
         ScenarioState.__post_init__(obj)  # Hack
         return obj
 
@@ -990,8 +1447,7 @@ class _HelmRunMsgspecView:
         contains the statistics produced for the metrics, aggregated across all
         instances (i.e. inputs).
         """
-        data = (self.parent.path / 'stats.json').read_bytes()
-        obj = util_msgspec.MSGSPEC_REGISTRY.decode(data, list[StatStruct])
+        obj = self._decode('stats.json', list[StatStruct])
         return obj
 
 
@@ -1027,11 +1483,18 @@ class _HelmRunDataFrameView:
             >>> print(table)
             >>> assert len(table) > 180
         """
+        return self._table(self._per_instance_stats_rows())
+
+    def _per_instance_stats_rows(self) -> list[dict]:
+        # Rows are built with their final (prefixed) column names so tables
+        # from many runs can be constructed in one shot by :class:`HelmRuns`.
+        run_spec_name = self.parent._run_spec_name
         instance_stats_list = self.parent.json.per_instance_stats()
         rows = []
         for item in instance_stats_list:
             # Each item should correspond to :class:`PerInstanceStats`
             stats_list = item.pop('stats')
+            item = {f'per_instance_stats.{k}': v for k, v in item.items()}
 
             # TODO: cook up a perturbed instance id by hashing
             # the optional perturbation field with instance-id.
@@ -1039,14 +1502,23 @@ class _HelmRunDataFrameView:
             # TODO: build demodata that contains perturbations
 
             for stats in stats_list:
-                row = kwutil.DotDict.from_nested(stats, prefix='stats')
+                # Enrich with contextual metadata (primary key for run_spec joins)
+                row = {'run_spec.name': run_spec_name}
+                row.update(kwutil.DotDict.from_nested(stats, prefix='per_instance_stats.stats'))
                 row.update(item)
                 rows.append(row)
+        return rows
+
+    def _all_rows(self) -> dict[str, list[dict]]:
+        # All tables of this run in one pass (see HelmRuns.aggregate_all)
+        return {key: getattr(self, f'_{key}_rows')() for key in _TABLE_KEYS}
+
+    @staticmethod
+    def _table(rows):
+        if len(rows) == 0:
+            # Keep the join key even when a run has no rows
+            return util_pandas.DotDictDataFrame(columns=['run_spec.name'])
         flat_table = util_pandas.DotDictDataFrame(rows)
-        # Add a prefix to enable joins for join keys
-        flat_table = flat_table.insert_prefix('per_instance_stats')
-        # Enrich with contextual metadata (primary key for run_spec joins)
-        flat_table['run_spec.name'] = self.parent.json.run_spec()['name']
         flat_table = flat_table.reorder(head=['run_spec.name'], axis=1)
         return flat_table
 
@@ -1061,12 +1533,14 @@ class _HelmRunDataFrameView:
             >>> print(table)
             >>> assert len(table) == 1
         """
-        nested = self.parent.json.run_spec()
-        flat_state = kwutil.DotDict.from_nested(nested)
-        flat_state = flat_state.insert_prefix('run_spec')
-        flat_table = util_pandas.DotDictDataFrame([flat_state])
+        flat_table = util_pandas.DotDictDataFrame(self._run_spec_rows())
         return flat_table
 
+    def _run_spec_rows(self) -> list[dict]:
+        nested = self.parent.json.run_spec()
+        flat_state = kwutil.DotDict.from_nested(nested, prefix='run_spec')
+        return [flat_state]
+
     def scenario(self):
         raise NotImplementedError('not sure if relevant')
 
@@ -1081,21 +1555,21 @@ class _HelmRunDataFrameView:
             >>> print(table)
             >>> assert len(table) >= 7
         """
+        return self._table(self._scenario_state_rows())
+
+    def _scenario_state_rows(self) -> list[dict]:
+        run_spec_name = self.parent._run_spec_name
         top_level = self.parent.json.scenario_state()
         request_states = top_level.pop('request_states')
-        flat_top_level = kwutil.DotDict.from_nested(top_level)
+        flat_top_level = kwutil.DotDict.from_nested(top_level, prefix='scenario_state')
         rows = []
         for item in request_states:
-            row = kwutil.DotDict.from_nested(item, prefix='request_states')
+            # Enrich with contextual metadata (primary key for run_spec joins)
+            row = {'run_spec.name': run_spec_name}
+            row.update(kwutil.DotDict.from_nested(item, prefix='scenario_state.request_states'))
             row.update(flat_top_level)
             rows.append(row)
-        flat_table = util_pandas.DotDictDataFrame(rows)
-        # Add a prefix to enable joins for join keys
-        flat_table = flat_table.insert_prefix('scenario_state')
-        # Enrich with contextual metadata (primary key for run_spec joins)
-        flat_table['run_spec.name'] = self.parent.json.run_spec()['name']
-        flat_table = flat_table.reorder(head=['run_spec.name'], axis=1)
-        return flat_table
+        return rows
 
     def stats(self) -> util_pandas.DotDictDataFrame:
         """
@@ -1108,17 +1582,20 @@ class _HelmRunDataFrameView:
             >>> print(table)
             >>> assert len(table) >= 160
         """
+        return self._table(self._stats_rows())
+
+    def _stats_rows(self) -> list[dict]:
+        run_spec_name = self.parent._run_spec_name
         stats_list = self.parent.json.stats()
         # TODO: it might be a good idea to hash the name fields to generate
         # unique ids for "types" of stats.
-        stats_flat = [kwutil.DotDict.from_nested(stats) for stats in stats_list]
-        flat_table = util_pandas.DotDictDataFrame(stats_flat)
-        # Add a prefix to enable joins for join keys
-        flat_table = flat_table.insert_prefix('stats')
-        # Enrich with contextual metadata (primary key for run_spec joins)
-        flat_table['run_spec.name'] = self.parent.json.run_spec()['name']
-        flat_table = flat_table.reorder(head=['run_spec.name'], axis=1)
-        return flat_table
+        rows = []
+        for stats in stats_list:
+            # Enrich with contextual metadata (primary key for run_spec joins)
+            row = {'run_spec.name': run_spec_name}
+            row.update(kwutil.DotDict.from_nested(stats, prefix='stats'))
+            rows.append(row)
+        return rows
 
 
 class HelmRun(ub.NiceRepr):
@@ -1164,7 +1641,7 @@ class HelmRun(ub.NiceRepr):
         >>> print(scenario_df)
     """
     def __init__(self, path):
-        self.path = ub.Path(path)
+        self.path = _as_path(path)
 
     @property
     def name(self):
@@ -1234,6 +1711,27 @@ class HelmRun(ub.NiceRepr):
         # Experimental, not part of the public API.
         return _HelmRunJsonView(self, backend='ujson')
 
+    @cached_property
+    def _run_spec_name(self):
+        # The dataframe views tag every row with the run spec name, so read
+        # it once rather than re-parsing run_spec.json for each table.
+        return self.json.run_spec()['name']
+
+    def invalidate(self):
+        """
+        Drop values cached from this run's files, so the next access rereads
+        them from disk.
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRun.demo()
+            >>> name = self._run_spec_name
+            >>> assert '_run_spec_name' in self.__dict__
+            >>> self.invalidate()
+            >>> assert '_run_spec_name' not in self.__dict__
+        """
+        self.__dict__.pop('_run_spec_name', None)
+
     def __nice__(self):
         return self.path.name
 
@@ -1253,7 +1751,7 @@ class HelmRun(ub.NiceRepr):
 
     @classmethod
     def _is_likely_a_run_path(cls, path):
-        return (path / 'run_spec.json').exists()
+        return os.path.exists(os.path.join(path, 'run_spec.json'))
 
     @classmethod
     def demo(cls) -> Self:
@@ -1263,6 +1761,22 @@ class HelmRun(ub.NiceRepr):
 
     # Default accessors
 
+    def load_all(self) -> dict[str, util_pandas.DotDictDataFrame]:
+        """
+        Dataframe representations of every table in this run.
+
+        Returns:
+            Dict[str, DotDictDataFrame]: the tables keyed by method name
+
+        Example:
+            >>> from magnet.backends.helm.helm_outputs import *  # NOQA
+            >>> self = HelmRun.demo()
+            >>> tables = self.load_all()
+            >>> assert tables['stats'].equals(self.stats())
+        """
+        rows = self.dataframe._all_rows()
+        return {key: HelmRuns._rows_to_table(key, rows[key]) for key in _TABLE_KEYS}
+
     def per_instance_stats(self) -> util_pandas.DotDictDataFrame:
         """
         Dataframe representation of :class:`PerInstanceStats`
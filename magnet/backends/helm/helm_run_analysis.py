@@ -26,7 +26,7 @@ Notes
 from __future__ import annotations
 
 import math
-from collections import Counter
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from typing import Any, Mapping
 
@@ -495,14 +495,14 @@ class JoinedInstanceStatTable(ub.NiceRepr):
         self.diagnostics['request_state_duplicates'] = dupes
 
         # 2) merge perinstance bundles into per-variant groups
-        tmp: dict[InstanceVariantKey, list[dict[str, Any]]] = {}
+        tmp: dict[InstanceVariantKey, list[dict[str, Any]]] = defaultdict(list)
 
         for row in self.perinstance_stats:
             iid = row.get('instance_id', None)
             tti = _coerce_int(row.get('train_trial_index', None))
             stats = row.get('stats', []) or []
             # group stats inside this row by their stat-name perturbation
-            per_pid: dict[str | None, list[dict[str, Any]]] = {}
+            per_pid: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
             for stat in stats:
                 name_obj = stat.get('name', None) or {}
                 stat_pid = None
@@ -511,13 +511,13 @@ class JoinedInstanceStatTable(ub.NiceRepr):
                         name_obj.get('perturbation', None),
                         short_hash=self.short_hash,
                     )
-                per_pid.setdefault(stat_pid, []).append(stat)
+                per_pid[stat_pid].append(stat)
 
             for stat_pid, subset in per_pid.items():
                 vk = InstanceVariantKey(iid, tti, stat_pid)
-                tmp.setdefault(vk, []).extend(subset)
+                tmp[vk].extend(subset)
 
-        self.stats_by_variant = tmp
+        self.stats_by_variant = dict(tmp)
 
         # 3) join into InstanceStatRow objects
         unmatched = []
@@ -1,13 +1,25 @@
 from dataclasses import replace
+from functools import lru_cache
 
 from helm.benchmark.run_spec import RunSpec, run_spec_function, get_run_spec_function
 from helm.benchmark.scenarios.scenario import ScenarioSpec
 
 @run_spec_function("local_dataset")
 def get_local_dataset_meta_spec(original_spec: str, instances_path: str, **kwargs) -> RunSpec:
+    # RunSpecs are frozen, so identical requests (common in matrix sweeps)
+    # can share one result.
+    kwargs_key = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_key)
+    except TypeError:
+        return _build_local_dataset_meta_spec(original_spec, instances_path, kwargs_key)
+    return _cached_local_dataset_meta_spec(original_spec, instances_path, kwargs_key)
+
+
+def _build_local_dataset_meta_spec(original_spec: str, instances_path: str, kwargs_key: tuple) -> RunSpec:
     run_spec_function = get_run_spec_function(original_spec)
 
-    original_run_spec = run_spec_function(**kwargs)
+    original_run_spec = run_spec_function(**dict(kwargs_key))
 
     local_dataset_scenario_spec = ScenarioSpec(
         class_name="magnet.backends.helm.scenarios.LocalDatasetScenario", args={"instances_path": instances_path}
@@ -16,3 +28,6 @@ def get_local_dataset_meta_spec(original_spec: str, instances_path: str, **kwarg
     run_spec = replace(original_run_spec, scenario_spec=local_dataset_scenario_spec)
 
     return run_spec
+
+
+_cached_local_dataset_meta_spec = lru_cache(maxsize=None)(_build_local_dataset_meta_spec)
@@ -1,11 +1,11 @@
 import json
 from typing import List, Dict, Any
 
-import dacite
 from helm.benchmark.scenarios.scenario import (
     Scenario,
     Instance,
 )
+from magnet.utils.util_dataclass import dataclass_from_dict_factory
 
 class LocalDatasetScenario(Scenario):
     name = "local_dataset"
@@ -24,6 +24,9 @@ class LocalDatasetScenario(Scenario):
         with open(self.instances_path) as f:
             json_instances: List[Dict[str, Any]] = json.load(f)
 
-        instances = [dacite.from_dict(Instance, instance) for instance in json_instances]
+        # All instances share one schema, so use a constructor specialized
+        # for it instead of having dacite re-inspect the types per instance.
+        make_instance = dataclass_from_dict_factory(Instance)
+        instances = [make_instance(instance) for instance in json_instances]
 
         return instances
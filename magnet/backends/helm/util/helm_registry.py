@@ -0,0 +1,42 @@
+"""magnet.backends.helm.util.helm_registry
+
+Guards around HELM's process-global config registries.
+
+HELM's ``register_builtin_configs_from_helm_package`` appends to global lists
+(e.g. ``model_deployment_registry.ALL_MODEL_DEPLOYMENTS``) and is not
+idempotent: calling it twice registers every deployment twice. Everything in
+MAGNET that needs the builtin configs should go through
+:func:`ensure_builtin_configs_registered` instead of calling HELM directly.
+"""
+
+from __future__ import annotations
+
+import threading
+
+_BUILTIN_CONFIGS_REGISTERED = False
+_REGISTRY_LOCK = threading.Lock()
+
+
+def ensure_builtin_configs_registered() -> None:
+    """
+    Register HELM's builtin model / tokenizer configs once per process.
+
+    Subsequent calls (including concurrent calls from other threads) are
+    no-ops.
+
+    Example:
+        >>> from magnet.backends.helm.util.helm_registry import ensure_builtin_configs_registered
+        >>> from helm.benchmark import model_deployment_registry
+        >>> ensure_builtin_configs_registered()
+        >>> num_deployments = len(model_deployment_registry.ALL_MODEL_DEPLOYMENTS)
+        >>> ensure_builtin_configs_registered()
+        >>> assert len(model_deployment_registry.ALL_MODEL_DEPLOYMENTS) == num_deployments
+    """
+    global _BUILTIN_CONFIGS_REGISTERED
+    if _BUILTIN_CONFIGS_REGISTERED:
+        return
+    with _REGISTRY_LOCK:
+        if not _BUILTIN_CONFIGS_REGISTERED:
+            from helm.benchmark import config_registry
+            config_registry.register_builtin_configs_from_helm_package()
+            _BUILTIN_CONFIGS_REGISTERED = True
@@ -11,21 +11,99 @@ Example:
     >>> # Test version works
     >>> MagnetCLI.main(argv=['--version'])
 """
+import importlib
+import sys
 import scriptconfig as scfg
-from magnet.cli.download_cli import DownloadModalCLI
-from magnet.evaluation import EvaluationConfig
+from scriptconfig.util.util_class import class_or_instancemethod
 from magnet import __version__
 
 
+# Subcommands are imported on demand, so running one command does not pay
+# the import cost of the others (e.g. ``download`` does not need kwdagger
+# and pandas from the evaluation module).
+# The order here is the order they appear in the help.
+SUBCOMMANDS = {
+    'download': ('magnet.cli.download_cli', 'DownloadModalCLI'),
+    'evaluate': ('magnet.evaluation', 'EvaluationConfig'),
+}
+
+
+def _requested_subcommands(argv=None):
+    """
+    Determine which subcommands need to be imported to handle ``argv``.
+
+    Returns all subcommands unless the first positional token names one of
+    them, in which case that is the only one needed.
+
+    Example:
+        >>> from magnet.cli.main import _requested_subcommands
+        >>> _requested_subcommands(['download', 'helm', '--help'])
+        ['download']
+        >>> _requested_subcommands(['--help'])
+        ['download', 'evaluate']
+        >>> _requested_subcommands(['not-a-command'])
+        ['download', 'evaluate']
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    for token in argv:
+        if not token.startswith('-'):
+            command = token.replace('_', '-')
+            if command in SUBCOMMANDS:
+                return [command]
+            break
+    return list(SUBCOMMANDS)
+
+
 class MagnetCLI(scfg.ModalCLI):
     """
     Top level MAGNET CLI
     """
     __version__ = __version__
 
+    def __init__(self, description='', sub_clis=None, version=None,
+                 commands=None):
+        """
+        Args:
+            commands (List[str] | None):
+                names of the :data:`SUBCOMMANDS` to attach (and import).
+                Defaults to all of them. Ignored if ``sub_clis`` is given.
+
+        Example:
+            >>> from magnet.cli.main import MagnetCLI
+            >>> self = MagnetCLI()
+            >>> [m['command'] for m in self._subconfig_metadata]
+            ['download', 'evaluate']
+            >>> self = MagnetCLI(commands=['download'])
+            >>> [m['command'] for m in self._subconfig_metadata]
+            ['download']
+            >>> self.main(argv=['download', '--help'], _noexit=True)
+        """
+        if sub_clis is None:
+            sub_clis = _build_sub_clis(commands)
+        super().__init__(description=description, sub_clis=sub_clis,
+                         version=version)
+
+    @class_or_instancemethod
+    def main(self, argv=None, **kwargs):
+        if isinstance(self, type):
+            # Only import the subcommands this invocation needs
+            self = self(commands=_requested_subcommands(argv))
+        return super(MagnetCLI, self).main(argv=argv, **kwargs)
 
-MagnetCLI.register(DownloadModalCLI, command='download')
-MagnetCLI.register(EvaluationConfig, command='evaluate')
+
+def _build_sub_clis(commands=None):
+    """
+    Import the requested subcommand CLIs (all by default) in help order.
+    """
+    if commands is None:
+        commands = list(SUBCOMMANDS)
+    sub_clis = []
+    for command in commands:
+        modname, attr = SUBCOMMANDS[command]
+        cli_cls = getattr(importlib.import_module(modname), attr)
+        sub_clis.append({'cls': cli_cls, 'command': command})
+    return sub_clis
 
 
 __cli__ = MagnetCLI
@@ -1,3 +1,10 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+# NOTE: eq and repr are disabled because the fields hold DataFrames, which
+# do not support truthy comparison and are too large to usefully print.
+@dataclass(slots=True, eq=False, repr=False)
 class DataSplit:
     """
     Enapsulates data for a particualr data split
@@ -6,18 +13,28 @@ class DataSplit:
         run_specs: DataFrame | None
         scenario_state: DataFrame | None
         stats: DataFrame | None
+        per_instance_stats: DataFrame | None
+
+    Example:
+        >>> from magnet.data_splits import *  # NOQA
+        >>> split = TestSplit(run_specs='a', scenario_state='b', stats='c')
+        >>> sequestered = split.sequester()
+        >>> sequestered.run_specs, sequestered.stats
+        ('a', None)
+        >>> assert not hasattr(sequestered, '__dict__')
     """
-    def __init__(self, run_specs=None, scenario_state=None, stats=None, per_instance_stats=None):
-        self.run_specs = run_specs
-        self.scenario_state = scenario_state
-        self.stats = stats
-        self.per_instance_stats = per_instance_stats
+    run_specs: Any = None
+    scenario_state: Any = None
+    stats: Any = None
+    per_instance_stats: Any = None
 
 
+@dataclass(slots=True, eq=False, repr=False)
 class TrainSplit(DataSplit):
     ...
 
 
+@dataclass(slots=True, eq=False, repr=False)
 class TestSplit(DataSplit):
 
     def sequester(self):
@@ -31,8 +48,9 @@ class TestSplit(DataSplit):
         return sequestered_split
 
 
+@dataclass(slots=True, eq=False, repr=False)
 class SequesteredTestSplit(TestSplit):
-    def __init__(self, run_specs=None, scenario_state=None, stats=None, per_instance_stats=None):
-        assert stats is None, 'cannot specify stats here'
-        assert per_instance_stats is None, 'cannot specify per_instance_stats here'
-        super().__init__(run_specs=run_specs, scenario_state=scenario_state)
+
+    def __post_init__(self):
+        assert self.stats is None, 'cannot specify stats here'
+        assert self.per_instance_stats is None, 'cannot specify per_instance_stats here'
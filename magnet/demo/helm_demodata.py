@@ -16,7 +16,9 @@ class HelmDemoConfig(scfg.DataConfig):
     )
     suite = scfg.Value("my-suite", help="Name of the helm suite")
     max_eval_instances = scfg.Value(7, help="Maximum eval instances")
-    num_threads = scfg.Value(1, help="Number of threads")
+    num_threads = scfg.Value(None, help=(
+        "Number of threads. Defaults to one per run entry, capped at the "
+        "number of CPUs."))
 
 
 def ensure_helm_demo_outputs(**kwargs):
@@ -36,20 +38,32 @@ def ensure_helm_demo_outputs(**kwargs):
         >>> kwargs = {}
         >>> dpath = ensure_helm_demo_outputs(**kwargs)
     """
+    import hashlib
+    import json
+    import os
+
     import ubelt as ub
+
     base_dpath = ub.Path.appdir('magnet/tests/helm_output').ensuredir()
     config = HelmDemoConfig(**kwargs)
     config_dict = config.to_dict()
-    hash_id = ub.hash_data(config_dict)[0:12]
+    # A short blake2b digest is plenty for a cache directory name
+    config_text = json.dumps(config_dict, sort_keys=True, default=str)
+    hash_id = hashlib.blake2b(config_text.encode(), digest_size=6).hexdigest()
     dpath = (base_dpath / hash_id).ensuredir()
 
     stamp = ub.CacheStamp('helm_demo_outputs', depends=config_dict, dpath=dpath)
     if stamp.expired():
+        num_threads = config.num_threads
+        if num_threads is None:
+            # All entries go to a single helm-run, which parallelizes over
+            # them internally.
+            num_threads = min(len(config.run_entries), os.cpu_count() or 1)
 
         base_cmd = ["helm-run", "--run-entries"] + config.run_entries + [
             "--suite", config.suite,
             "--max-eval-instances", str(config.max_eval_instances),
-            "--num-threads", str(config.num_threads),
+            "--num-threads", str(num_threads),
         ]
         res = ub.cmd(base_cmd, cwd=dpath, verbose=3, system=True)
         res.check_returncode()
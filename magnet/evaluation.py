@@ -1,13 +1,23 @@
+import ast
 import builtins
+import copy
 import json
+import math
 import os
 import sys
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from graphlib import TopologicalSorter
-from itertools import product
-from typing import Any, Dict, List, Optional, Self, Tuple, get_args, get_origin
+from itertools import product, repeat
+from types import CodeType
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Mapping, Optional, Self, Tuple,
+    get_args, get_origin,
+)
 
 import kwutil
+import numpy as np
 import scriptconfig as scfg
 import ubelt as ub
 import yaml
@@ -24,6 +34,9 @@ SAFER_USE_TEMPFILE = not ub.WIN32
 
 DEFAULT_CLAIM_AGGREGATION_STRATEGY = {'type': 'all'}
 
+# Prefer the LibYAML C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class EvaluationConfig(scfg.DataConfig):
     """
@@ -72,6 +85,21 @@ class EvaluationConfig(scfg.DataConfig):
         help='Joblib backend used when --jobs is not 1.',
     )
 
+    verbose = scfg.Value(
+        False,
+        isflag=True,
+        help='Print the outcome of every sweep setting, not just the summary.',
+    )
+
+    fail_fast = scfg.Value(
+        False,
+        isflag=True,
+        help=(
+            'Stop evaluating sweep settings once one is FALSIFIED '
+            '(only with the "all" claim aggregation strategy).'
+        ),
+    )
+
     validate = scfg.Value(
         'error',
         type=str,
@@ -84,12 +112,57 @@ class EvaluationConfig(scfg.DataConfig):
         ),
     )
 
+@lru_cache(maxsize=None)
+def _compile_source(source: str, filename: str, mode: str = 'exec') -> CodeType:
+    """
+    Compile claim / symbol source code, shared across all sweep rows.
+
+    Every row of a sweep builds its own Claim and Symbol objects from the same
+    card text, so caching on the source avoids recompiling it per row.
+    """
+    return compile(source, filename, mode)
+
+
+@lru_cache(maxsize=None)
+def _parse_type_str(type_str: str) -> Any:
+    """
+    Evaluate a symbol type annotation string, shared across all symbols.
+
+    Example:
+        >>> from magnet.evaluation import _parse_type_str
+        >>> _parse_type_str('List[int]')
+        typing.List[int]
+    """
+    # TODO: static 'vocabulary' of allowable types / support more than List[Any], Dict[str, Any]
+    str_to_type = {'List': List, 'Dict': Dict, 'Tuple': Tuple, 'Any': Any}
+    return eval(type_str, str_to_type)
+
+
+@lru_cache(maxsize=None)
+def _topological_order(
+    dependency_graph: Tuple[Tuple[str, Tuple[str, ...]], ...],
+) -> Tuple[str, ...]:
+    """
+    Sort a (frozen) symbol dependency graph, shared across Symbols with the
+    same topology.
+
+    Example:
+        >>> from magnet.evaluation import _topological_order
+        >>> _topological_order((('c', ('a', 'b')), ('b', ('a',)), ('a', ())))
+        ('a', 'b', 'c')
+    """
+    sorter = TopologicalSorter(dict(dependency_graph))
+    return tuple(sorter.static_order())
+
+
 # Claim Resolution (pulled out as standalone function for
 # multiprocessing support)
 def _run_one(
     evaluation: 'EvaluationTask', claim_results_path: ub.Path
-) -> Tuple[str, ub.Path]:
-    status, _ = evaluation.execute()
+) -> Tuple['EvaluationTask', ub.Path]:
+    # The executed task is returned because worker processes operate on
+    # copies: the parent needs the worker's resolved symbols and status.
+    evaluation.execute()
     results_fpath = (
         claim_results_path / evaluation._execution_hash / 'verdict.json'
     )
@@ -99,7 +172,56 @@ def _run_one(
         json.dump(evaluation.log, f, indent=2, ensure_ascii=False)
         f.write('\n')
 
-    return status, results_fpath
+    return evaluation, results_fpath
+
+
+def _skip_yaml_node(events: Iterator[yaml.Event], first: yaml.Event) -> None:
+    """
+    Consume the remaining events of the node that starts with ``first``
+    """
+    depth = int(isinstance(first, (yaml.MappingStartEvent, yaml.SequenceStartEvent)))
+    while depth:
+        event = next(events)
+        if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+
+
+def _peek_sweep_size(events: Iterator[yaml.Event]) -> int:
+    """
+    Multiply the lengths of all ``sweep`` lists in a ``symbols`` mapping
+    whose start event has already been consumed
+
+    Like :func:`Symbols.flatten`, empty sweeps are not sweeps at all, so a
+    card without any non-empty sweep has a single setting.
+    """
+    sweep_size = 1
+    for name_event in events:
+        if isinstance(name_event, yaml.MappingEndEvent):
+            break
+        spec_event = next(events)
+        if not isinstance(spec_event, yaml.MappingStartEvent):
+            _skip_yaml_node(events, spec_event)
+            continue
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                break
+            value_event = next(events)
+            if getattr(key_event, 'value', None) == 'sweep' and isinstance(
+                value_event, yaml.SequenceStartEvent
+            ):
+                num_items = 0
+                for item_event in events:
+                    if isinstance(item_event, yaml.SequenceEndEvent):
+                        break
+                    _skip_yaml_node(events, item_event)
+                    num_items += 1
+                if num_items:
+                    sweep_size *= num_items
+            else:
+                _skip_yaml_node(events, value_event)
+    return sweep_size
 
 
 class EvaluationCard:
@@ -157,8 +279,8 @@ class EvaluationCard:
     """
 
     def __init__(self, path, output_path: str | os.PathLike[str], validate='error'):
-        with open(path, 'r') as f:
-            cfg = yaml.safe_load(f)
+        with open(path, 'rb') as f:
+            cfg = yaml.load(f, Loader=_YAML_LOADER)
         if validate in ('error', 'warning'):
             try:
                 EvaluationCardSchema.model_validate(cfg)
@@ -189,6 +311,69 @@ class EvaluationCard:
 
         self.evaluations = []
 
+    @classmethod
+    def peek(cls, path: str | os.PathLike[str]) -> Dict[str, Any]:
+        """
+        Read a card's title, description, and number of sweep settings
+        (from symbol ``sweep`` lists) without loading, validating, or
+        constructing the rest of it
+
+        The YAML is walked as an event stream: claim, pipeline, and symbol
+        definitions are skipped over without being constructed, and reading
+        stops once the needed keys have been seen.
+
+        Example:
+            >>> from importlib.resources import files
+            >>> from magnet.evaluation import EvaluationCard
+            >>> info = EvaluationCard.peek(files('magnet') / 'cards' / 'simple.yaml')
+            >>> info['title'], info['sweep_size']
+            ('Arithmetic - Addition Commutative Property', 1)
+            >>> import ubelt as ub
+            >>> dpath = ub.Path.appdir('magnet/tests/peek').ensuredir()
+            >>> fpath = dpath / 'card.yaml'
+            >>> _ = fpath.write_text(ub.codeblock(
+            ...     '''
+            ...     title: sweep
+            ...     symbols:
+            ...       a: {sweep: [1, 2, 3]}
+            ...       b:
+            ...         sweep: [[0], [1, 2]]
+            ...       c: {python: 'c = a + b'}
+            ...     description: late description
+            ...     '''))
+            >>> EvaluationCard.peek(fpath)
+            {'title': 'sweep', 'description': 'late description', 'sweep_size': 6}
+        """
+        info = {'title': None, 'description': None, 'sweep_size': 1}
+        remaining = {'title', 'description', 'symbols'}
+        with open(path, 'rb') as f:
+            events = iter(yaml.parse(f, Loader=_YAML_LOADER))
+            for event in events:
+                if isinstance(event, yaml.MappingStartEvent):
+                    break
+            else:
+                return info
+
+            for key_event in events:
+                if isinstance(key_event, yaml.MappingEndEvent):
+                    break
+                value_event = next(events)
+                key = getattr(key_event, 'value', None)
+                if key in ('title', 'description') and isinstance(
+                    value_event, yaml.ScalarEvent
+                ):
+                    info[key] = value_event.value
+                elif key == 'symbols' and isinstance(
+                    value_event, yaml.MappingStartEvent
+                ):
+                    info['sweep_size'] = _peek_sweep_size(events)
+                else:
+                    _skip_yaml_node(events, value_event)
+                remaining.discard(key)
+                if not remaining:
+                    break
+        return info
+
     def status(self) -> str:
         """
         Declaration of card state, whether not started, in progress, or complete
@@ -229,7 +414,13 @@ class EvaluationCard:
                 else:
                     self.symbols[key]['sweep'] = [value]
 
-    def evaluate(self, jobs: int = 1, parallel_backend: str = 'loky') -> str:
+    def evaluate(
+        self,
+        jobs: int = 1,
+        parallel_backend: str = 'loky',
+        verbose: bool = False,
+        fail_fast: bool = False,
+    ) -> str:
         """
         Run the evaluation specification
 
@@ -247,8 +438,20 @@ class EvaluationCard:
         │   │           ├── card.yaml
         │   │           └── kwdagger
         │   │           └── results
+
+        With ``fail_fast`` and the default 'all' aggregation strategy, no
+        further settings are evaluated once one is FALSIFIED, since that
+        already decides the card.
         """
-        results = []
+        result_counts = Counter()
+        stop_on_falsified = fail_fast and (
+            self.claim_aggregation_strategy.get('type', 'all') == 'all'
+        )
+        if fail_fast and not stop_on_falsified:
+            logger.warning(
+                'fail_fast only applies to the "all" claim aggregation '
+                'strategy; evaluating every setting'
+            )
 
         card_output_path = self.output_path / self._run_hash
         card_output_path.ensuredir()
@@ -260,6 +463,8 @@ class EvaluationCard:
 
         claim_results_path = card_output_path / 'results'
 
+        # NOTE: the pipeline branches update self.symbols between runs, so
+        # their tasks must be materialized before the next update.
         if self.has_kwdagger:
             # Explicit kwdagger pipeline defined
             # Claim node handles symbols outside of EvaluationCard
@@ -267,10 +472,11 @@ class EvaluationCard:
                 self.kwdagger, root_dpath=card_output_path / 'kwdagger'
             ).collect_results()
 
+            tasks = []
             for sweep in symbols:
                 symbol_with_value = {s: {'value': v} for s, v in sweep.items()}
                 self.symbols.update(symbol_with_value)
-                self.evaluations.extend(
+                tasks.extend(
                     self.dispatch(Symbols.decompose_symbol_defs(self.symbols))
                 )
 
@@ -280,42 +486,60 @@ class EvaluationCard:
                 self.pipeline, root_dpath=card_output_path / 'kwdagger'
             ).collect_symbols()
 
+            tasks = []
             for run in pipeline_runs:
                 run_symbols = pipeline_runs[run]
                 self.symbols.update(run_symbols)
-                self.evaluations.extend(
+                tasks.extend(
                     self.dispatch(Symbols.decompose_symbol_defs(self.symbols))
                 )
 
         else:
             # Serial Evaluation Card
-            self.evaluations = self.dispatch(
-                Symbols.decompose_symbol_defs(self.symbols)
+            self.evaluations = []
+            aggregate_symbols = Symbols(self.symbols)
+            # Settings where a numeric claim provably holds can skip
+            # executing the claim (falsified settings still run it in full
+            # so they report their exact assertion message).
+            known_verified = _vectorized_claim_outcomes(
+                self.claim, aggregate_symbols
             )
+            tasks = self.dispatch(aggregate_symbols.flatten(), known_verified)
 
+        # Tasks are created, executed, and written out one at a time
         if jobs == 1:
-            out = [_run_one(e, claim_results_path) for e in self.evaluations]
+            out = (_run_one(e, claim_results_path) for e in tasks)
         else:
             from joblib import Parallel, delayed
 
-            out = Parallel(n_jobs=jobs, backend=parallel_backend, verbose=5)(
-                delayed(_run_one)(e, claim_results_path)
-                for e in self.evaluations
-            )
-
-        results = []
-        for status, results_fpath in out:
-            results.append(status)
-            print(f'Wrote claim output to {results_fpath}')
-
-        total = len(results)
+            # Results are consumed as they arrive so fail_fast can stop
+            # the remaining jobs.
+            out = Parallel(
+                n_jobs=jobs,
+                backend=parallel_backend,
+                verbose=5,
+                return_as='generator',
+            )(delayed(_run_one)(e, claim_results_path) for e in tasks)
+
+        for evaluation, results_fpath in out:
+            self.evaluations.append(evaluation)
+            result_counts[evaluation.result] += 1
+            if verbose:
+                print(f'{evaluation.result}: {evaluation.output_msg}')
+                print(f'Wrote claim output to {results_fpath}')
+            if stop_on_falsified and evaluation.result == 'FALSIFIED':
+                print('Stopping at the first FALSIFIED setting (fail_fast)')
+                break
+
+        total = result_counts.total()
+        print(f'Wrote {total} claim outputs to {claim_results_path}')
 
         def percentage(count):
             return count / total
 
-        verified_count = results.count('VERIFIED')
-        falsified_count = results.count('FALSIFIED')
-        inconclusive_count = results.count('INCONCLUSIVE')
+        verified_count = result_counts['VERIFIED']
+        falsified_count = result_counts['FALSIFIED']
+        inconclusive_count = result_counts['INCONCLUSIVE']
 
         print('================================')
         print(f'Settings Evaluated: {total}')
@@ -325,7 +549,9 @@ class EvaluationCard:
         print('================================')
         print('\n')
 
-        card_result = _reduce_results(results, self.claim_aggregation_strategy)
+        card_result = _reduce_results(
+            result_counts, self.claim_aggregation_strategy
+        )
         aggregate_verdict = {
             'result': card_result,
             'claim_aggregation_strategy': self.claim_aggregation_strategy,
@@ -342,12 +568,16 @@ class EvaluationCard:
         return card_result
 
     def dispatch(
-        self, flattened_sweep: List['Symbols']
-    ) -> List['EvaluationTask']:
-        return [
-            EvaluationTask(Claim({'python': self.claim.claim}), symbols)
-            for symbols in flattened_sweep
-        ]
+        self,
+        flattened_sweep: Iterable['Symbols'],
+        known_verified: Optional[Iterable[bool]] = None,
+    ) -> Iterator['EvaluationTask']:
+        if known_verified is None:
+            known_verified = repeat(False)
+        for symbols, verified in zip(flattened_sweep, known_verified):
+            yield EvaluationTask(
+                Claim({self.claim.key: self.claim.claim}), symbols, verified
+            )
 
     def summarize(self) -> None:
         """
@@ -626,9 +856,14 @@ class EvaluationTask:
     Singular submission from an Evaluation Card
     """
 
-    def __init__(self, claim: 'Claim', symbols: 'Symbols') -> None:
+    def __init__(
+        self, claim: 'Claim', symbols: 'Symbols', known_verified: bool = False
+    ) -> None:
         self.claim = claim
         self.symbols = symbols
+        # Set when the claim was already shown to hold for these symbols
+        # (see _vectorized_claim_outcomes)
+        self.known_verified = known_verified
         self.output_msg = ''
         self.log = ''
 
@@ -638,7 +873,10 @@ class EvaluationTask:
         #           ...
         #           zn -> an -> resn
         # make sure x,y are done once / before sweep
-        self.result, self.output_msg = self.claim.evaluate(self.symbols())
+        if self.known_verified:
+            self.result, self.output_msg = self.claim.verified()
+        else:
+            self.result, self.output_msg = self.claim.evaluate(self.symbols())
         self.record_run()
         return self.result, self.output_msg
 
@@ -656,24 +894,38 @@ class EvaluationTask:
         return ub.hash_data(self.symbols.simple_view())[:12]
 
 
-def _reduce_results(results: List[str], reduce_spec: Dict[str, Any]) -> str:
+def _reduce_results(
+    result_counts: Mapping[str, int], reduce_spec: Dict[str, Any]
+) -> str:
     """
     Reduce per-sweep-point claim outcomes to a single card-level status.
 
+    result_counts: number of sweep points per outcome, e.g. a Counter of
+    'VERIFIED' / 'FALSIFIED' / 'INCONCLUSIVE'.
+
     reduce_spec: dict with key `type`:
       - {'type': 'all'}               any FALSIFIED -> FALSIFIED; any INCONCLUSIVE -> INCONCLUSIVE; else VERIFIED
       - {'type': 'any'}               any VERIFIED -> VERIFIED; any INCONCLUSIVE (and no VERIFIED) -> INCONCLUSIVE; else FALSIFIED
       - {'type': 'fraction', 'parameters': {'threshold': 0.8}}
                                       VERIFIED_count / total >= threshold -> VERIFIED; else FALSIFIED.
                                       INCONCLUSIVE points count in the denominator but not the numerator.
+
+    Example:
+        >>> from magnet.evaluation import _reduce_results
+        >>> from collections import Counter
+        >>> counts = Counter(['VERIFIED', 'VERIFIED', 'FALSIFIED'])
+        >>> _reduce_results(counts, {'type': 'all'})
+        'FALSIFIED'
+        >>> _reduce_results(counts, {'type': 'any'})
+        'VERIFIED'
     """
-    total = len(results)
+    total = sum(result_counts.values())
     if total == 0:
         return 'INCONCLUSIVE'
 
-    verified_count = results.count('VERIFIED')
-    falsified_count = results.count('FALSIFIED')
-    inconclusive_count = results.count('INCONCLUSIVE')
+    verified_count = result_counts.get('VERIFIED', 0)
+    falsified_count = result_counts.get('FALSIFIED', 0)
+    inconclusive_count = result_counts.get('INCONCLUSIVE', 0)
 
     rtype = reduce_spec.get('type', 'all')
     if rtype == 'all':
@@ -704,6 +956,186 @@ def _reduce_results(results: List[str], reduce_spec: Dict[str, Any]) -> str:
     raise ValueError(f'Unknown reduce type: {rtype!r}')
 
 
+# Numeric syntax that evaluates identically for Python scalars and NumPy
+# arrays (elementwise). Anything else falls back to per-setting evaluation.
+_VECTORIZABLE_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.BinOp, ast.UnaryOp,
+    ast.Compare, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod,
+    ast.USub, ast.UAdd, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+)
+# Bound on the magnitude of every integer intermediate in a vectorized claim.
+# Below it int64 arithmetic cannot wrap (NumPy and numexpr wrap silently) and
+# int -> float64 conversions are exact, so results match Python's ints.
+_VECTORIZABLE_INT_BOUND = 2 ** 53
+# Sweep size at which numexpr's fused evaluation beats plain NumPy
+_NUMEXPR_MIN_SETTINGS = 2 ** 16
+
+
+def _vectorized_claim_outcomes(
+    claim: 'Claim', symbols: 'Symbols'
+) -> Optional[List[bool]]:
+    """
+    Evaluate a numeric claim over an entire sweep at once with NumPy.
+
+    Applies when the claim is a single comparison (an expression claim or a
+    lone ``assert``) using arithmetic only, every swept value is a number,
+    and every other symbol is a number that does not depend on the sweep.
+
+    Returns:
+        List[bool] | None: whether the claim holds for each sweep setting, in
+        the order produced by :func:`Symbols.flatten`, or None if the claim /
+        sweep cannot be vectorized.
+
+    Example:
+        >>> from magnet.evaluation import Claim, Symbols, _vectorized_claim_outcomes
+        >>> symbols = Symbols({
+        ...     'x': {'sweep': [1, 2, 3]},
+        ...     'y': {'sweep': [0, 2]},
+        ...     'offset': {'type': 'int', 'python': 'offset = 1'},
+        ... })
+        >>> claim = Claim({'python': 'assert x + offset > y, f"{x} {y}"'})
+        >>> _vectorized_claim_outcomes(claim, symbols)
+        [True, False, True, True, True, True]
+        >>> _vectorized_claim_outcomes(Claim({'python': 'assert len([x]) == 1'}), symbols) is None
+        True
+    """
+    sweep_symbols = symbols._find_sweep_symbols()
+    if not sweep_symbols:
+        return None
+    tree = claim.expression_tree
+    if tree is None:
+        return None
+    if not all(isinstance(node, _VECTORIZABLE_NODES) for node in ast.walk(tree)):
+        return None
+
+    def is_number(value):
+        return type(value) is int or type(value) is float
+
+    if not all(is_number(v) for symbol in sweep_symbols for v in symbol.sweep):
+        return None
+
+    sweep_names = [symbol.name for symbol in sweep_symbols]
+    symbols._resolve_invariant_symbols(sweep_names)
+    namespace = {}
+    for name, symbol in symbols.symbols.items():
+        if name in sweep_names:
+            continue
+        if not is_number(symbol.value):
+            return None
+        namespace[name] = symbol.value
+
+    magnitudes = {
+        name: (abs(value), type(value) is int)
+        for name, value in namespace.items()
+    }
+    for symbol in sweep_symbols:
+        magnitudes[symbol.name] = (
+            max(abs(v) for v in symbol.sweep),
+            all(type(v) is int for v in symbol.sweep),
+        )
+    if not _int_magnitudes_within_bound(tree.body, magnitudes):
+        return None
+
+    # ij-indexed grids ravel in the same order as itertools.product
+    grids = np.meshgrid(
+        *[np.asarray(symbol.sweep) for symbol in sweep_symbols], indexing='ij'
+    )
+    namespace.update(
+        {name: grid.ravel() for name, grid in zip(sweep_names, grids)}
+    )
+    outcomes = None
+    num_settings = grids[0].size
+    if num_settings >= _NUMEXPR_MIN_SETTINGS and not any(
+        isinstance(node, (ast.Div, ast.FloorDiv, ast.Mod))
+        for node in ast.walk(tree)
+    ):
+        # numexpr fuses the arithmetic and comparisons into one blocked,
+        # multithreaded pass without full-size temporaries. It does not
+        # raise on division by zero, so divisions always use NumPy. Like
+        # NumPy it wraps int64 overflow silently; the magnitude check above
+        # keeps every integer intermediate in range for both.
+        import numexpr
+        try:
+            outcomes = numexpr.evaluate(ast.unparse(tree), local_dict=namespace)
+        except Exception:
+            outcomes = None
+    if outcomes is None:
+        try:
+            with np.errstate(all='raise'):
+                outcomes = eval(compile(tree, '<claim>', 'eval'), namespace)
+        except Exception:
+            return None
+    outcomes = np.asarray(outcomes)
+    if outcomes.dtype != bool or outcomes.shape != (num_settings,):
+        return None
+    return outcomes.tolist()
+
+
+def _int_magnitudes_within_bound(node, magnitudes) -> bool:
+    """
+    Check that no integer subexpression of a vectorizable claim can reach
+    :data:`_VECTORIZABLE_INT_BOUND`, given an upper bound on the magnitude of
+    each name (and whether it is always an int).
+
+    Example:
+        >>> import ast
+        >>> from magnet.evaluation import _int_magnitudes_within_bound
+        >>> magnitudes = {'x': (2 ** 20, True), 'y': (2 ** 20, True), 'z': (2 ** 20, True)}
+        >>> _int_magnitudes_within_bound(ast.parse('x * y < 0', mode='eval').body, magnitudes)
+        True
+        >>> _int_magnitudes_within_bound(ast.parse('x * y * z < 0', mode='eval').body, magnitudes)
+        False
+        >>> magnitudes['z'] = (2.0 ** 20, False)
+        >>> _int_magnitudes_within_bound(ast.parse('x * y * z < 0', mode='eval').body, magnitudes)
+        True
+    """
+    def visit(node):
+        # (magnitude bound, is_int) of the subexpression, or None if it is
+        # not understood or an integer bound is exceeded.
+        result = bound_of(node)
+        if result is not None and result[1] and result[0] >= _VECTORIZABLE_INT_BOUND:
+            return None
+        return result
+
+    def bound_of(node):
+        if isinstance(node, ast.Name):
+            return magnitudes.get(node.id, None)
+        if isinstance(node, ast.Constant):
+            value = node.value
+            if type(value) is bool or type(value) is int:
+                return abs(value), True
+            if type(value) is float:
+                return abs(value), False
+            return None
+        if isinstance(node, ast.Compare):
+            for operand in [node.left, *node.comparators]:
+                if visit(operand) is None:
+                    return None
+            return 1, True
+        if isinstance(node, ast.UnaryOp):
+            return visit(node.operand)
+        if isinstance(node, ast.BinOp):
+            left = visit(node.left)
+            right = visit(node.right)
+            if left is None or right is None:
+                return None
+            if isinstance(node.op, ast.Div):
+                return math.inf, False
+            is_int = left[1] and right[1]
+            if isinstance(node.op, (ast.Add, ast.Sub)):
+                bound = left[0] + right[0]
+            elif isinstance(node.op, ast.Mult):
+                bound = left[0] * right[0]
+            elif isinstance(node.op, ast.FloorDiv):
+                bound = left[0] + 1
+            else:  # ast.Mod
+                bound = right[0]
+            return bound, is_int
+        return None
+
+    return visit(node) is not None
+
+
 class Claim:
     """
     Represents a verifiable assertion for a set of resolved symbols
@@ -716,6 +1148,12 @@ class Claim:
     4. Any conclusions drawn are as reliable as claim itself (i.e. verification is strictly: 'does code execute without error')
     ***
 
+    A claim is either a ``python`` block that is executed and holds if it
+    does not raise an AssertionError, or a single boolean ``expression``
+    that holds if it evaluates to a truthy value. Prefer ``expression`` for
+    simple checks: evaluating an expression is cheaper than executing a
+    block, which matters when a claim is checked for every row of a sweep.
+
     Example:
         >>> from magnet.evaluation import Claim
         >>> self = Claim({'python': "assert x + 2 == 4"})
@@ -724,19 +1162,84 @@ class Claim:
         >>> self.evaluate({'x': 2})
         >>> print(self.status)
         VERIFIED
+
+    Example:
+        >>> from magnet.evaluation import Claim
+        >>> self = Claim({'expression': "abs(x - y) < 0.5"})
+        >>> self.evaluate({'x': 2, 'y': 3})
+        >>> print(self.status)
+        FALSIFIED
     """
 
     def __init__(self, raw: Dict[str, str]) -> None:
-        self.claim = raw.get('python', '')
+        if raw.get('expression') is not None:
+            self.key = 'expression'
+            self.mode = 'eval'
+        else:
+            self.key = 'python'
+            self.mode = 'exec'
+        self.claim = raw.get(self.key) or ''
         self.status = 'UNVERIFIED'
+        self._code = None
+
+    @property
+    def code(self) -> CodeType:
+        """
+        The claim compiled to a code object (compiled once, on first use)
+        """
+        if self._code is None:
+            self._code = _compile_source(self.claim, '<claim>', self.mode)
+        return self._code
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Code objects cannot be pickled; workers recompile on first use.
+        state = self.__dict__.copy()
+        state['_code'] = None
+        return state
+
+    @property
+    def expression_tree(self) -> Optional[ast.Expression]:
+        """
+        The claim as a boolean expression, if it can be written as one
+
+        Expression claims are used as-is and a claim consisting of a single
+        ``assert`` statement is reduced to the asserted test. Any other claim
+        returns None.
+
+        Example:
+            >>> from magnet.evaluation import Claim
+            >>> import ast
+            >>> ast.unparse(Claim({'python': 'assert x > 0, "x must be positive"'}).expression_tree)
+            'x > 0'
+            >>> Claim({'python': 'for v in x:\\n    assert v > 0'}).expression_tree is None
+            True
+        """
+        try:
+            if self.mode == 'eval':
+                return ast.parse(self.claim, mode='eval')
+            tree = ast.parse(self.claim)
+        except SyntaxError:
+            return None
+        if len(tree.body) != 1 or not isinstance(tree.body[0], ast.Assert):
+            return None
+        return ast.Expression(tree.body[0].test)
+
+    def verified(self) -> Tuple[str, str]:
+        """
+        Record that the claim holds without executing it
+        """
+        self.status = 'VERIFIED'
+        if self.mode == 'eval':
+            return self.status, 'Expression holds'
+        return self.status, 'Assertion holds'
 
-    def evaluate(self, symbols: Dict[str, Any] = {}) -> Tuple[str, str]:
+    def evaluate(self, symbols: Optional[Dict[str, Any]] = None) -> Tuple[str, str]:
         """
         Execute the claim subject to symbols definitions
 
         if True:
             VERIFIED
-        elif AssertionError:
+        elif AssertionError (or a falsy expression):
             FALSIFIED
         else:
             INCONCLUSIVE
@@ -744,9 +1247,20 @@ class Claim:
         out_msg = ''
         try:
             out_msg = ''
-            exec(self.claim, symbols)
-            self.status = 'VERIFIED'
-            out_msg = 'Assertion holds'
+            # The claim runs in (and adds names to) its own copy of the
+            # symbols, so the caller's mapping is left untouched.
+            namespace = {} if symbols is None else dict(symbols)
+            if self.mode == 'eval':
+                if eval(self.code, namespace):
+                    self.status = 'VERIFIED'
+                    out_msg = 'Expression holds'
+                else:
+                    self.status = 'FALSIFIED'
+                    out_msg = f'Expression does not hold: {self.claim}'
+            else:
+                exec(self.code, namespace)
+                self.status = 'VERIFIED'
+                out_msg = 'Assertion holds'
         except AssertionError as e:
             self.status = 'FALSIFIED'
             out_msg = f'Assertion does not hold: {e}'
@@ -758,8 +1272,7 @@ class Claim:
             self.status = 'INCONCLUSIVE'
             out_msg = f'ERROR evaluating claim: {e}'
         finally:
-            if out_msg:
-                print(out_msg)
+            # Outcomes are reported by the caller (see EvaluationCard.evaluate)
             return self.status, out_msg
 
     def __repr__(self) -> str:
@@ -778,12 +1291,105 @@ class Symbol:
     """
 
     def __init__(self, name: str, spec: Dict[str, Any]) -> None:
+        # The Symbols collection (if any) whose cached values view this
+        # symbol's value belongs to.
+        self._owner = None
         self.name = name
         self.value = spec.get('value')
         self.sweep = spec.get('sweep')
         self.type = spec.get('type', 'List[int]')
-        self.definition = spec.get('python', '')
+        self.definition = spec.get('python') or ''
         self.dependencies = spec.get('depends_on', [])
+        self.cache = spec.get('cache', False)
+        self._code = None
+        self._global_names = None
+        self._parsed_type = None
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+        if self._owner is not None:
+            self._owner._values = None
+
+    @property
+    def code(self) -> CodeType:
+        """
+        The definition compiled to a code object (compiled once, on first use)
+        """
+        if self._code is None:
+            self._code = _compile_source(self.definition, f'<symbol:{self.name}>')
+        return self._code
+
+    @property
+    def global_names(self) -> Tuple[str, ...]:
+        """
+        Global names the definition (including nested functions) refers to
+
+        Example:
+            >>> from magnet.evaluation import Symbol
+            >>> x = Symbol('x', {'python': 'def f():\\n    global y\\n    y = 1\\nx = [len([])]'})
+            >>> sorted(x.global_names)
+            ['f', 'len', 'x', 'y']
+        """
+        if self._global_names is None:
+            names = set()
+            stack = [self.code]
+            while stack:
+                code = stack.pop()
+                names.update(code.co_names)
+                stack.extend(c for c in code.co_consts if isinstance(c, CodeType))
+            self._global_names = tuple(names)
+        return self._global_names
+
+    @property
+    def parsed_type(self) -> Any:
+        """
+        The type annotation string evaluated to a typing object (parsed once)
+
+        Example:
+            >>> from magnet.evaluation import Symbol
+            >>> Symbol('x', {'type': 'Dict[str, List[int]]'}).parsed_type
+            typing.Dict[str, typing.List[int]]
+        """
+        if self._parsed_type is None:
+            self._parsed_type = _parse_type_str(self.type)
+        return self._parsed_type
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Code objects cannot be pickled; workers recompile on first use.
+        state = self.__dict__.copy()
+        state['_code'] = None
+        return state
+
+    def copy(self) -> 'Symbol':
+        """
+        Copy that shares the definition, compiled code, and parsed type
+
+        A resolved value is shared only if it is immutable; otherwise the
+        copy gets its own deep copy so mutating one does not affect the
+        other.
+
+        Example:
+            >>> from magnet.evaluation import Symbol
+            >>> x = Symbol('x', {'python': 'x = [10]'})
+            >>> y = x.copy()
+            >>> y.value = [3]
+            >>> x.value is None and y.code is x.code
+            True
+            >>> z = y.copy()
+            >>> z.value.append(4)
+            >>> y.value
+            [3]
+        """
+        new = Symbol.__new__(Symbol)
+        new.__dict__.update(self.__dict__)
+        if not _is_immutable_value(self._value):
+            new._value = copy.deepcopy(self._value)
+        return new
 
     def eval(self, context: Dict[str, Any] = {}) -> Any:
         """
@@ -792,61 +1398,151 @@ class Symbol:
         FIXME: type verification is currently limited and hacky
         """
         if self.value is None:
-            print(f'Resolving: {self.name}')
-            exec(self.definition, context)
-            if self._check_type(self.type, context[self.name]):
+            logger.trace(f'Resolving: {self.name}')
+            cacher = self._cacher(context) if self.cache else None
+            if cacher is not None:
+                cached = cacher.tryload()
+                if cached is not None:
+                    self.value = cached
+                    return self.value
+
+            code = self.code
+            # Names the definition may bind (imports, helpers, ...) or
+            # rebind. Only the symbol itself is kept: new names are removed
+            # and rebound ones restored so later definitions do not see them.
+            names = [name for name in self.global_names if name != self.name]
+            saved = {name: context[name] for name in names if name in context}
+            exec(code, context)
+            for name in names:
+                if name in saved:
+                    context[name] = saved[name]
+                else:
+                    context.pop(name, None)
+            if self._check_type(context[self.name]):
                 self.value = context[self.name]
             else:
                 raise TypeError(
                     f'{self.name}: {context[self.name]} is not {self.type}'
                 )
+            if cacher is not None:
+                cacher.save(self.value)
 
         return self.value
 
-    def _check_type(self, type_str: str, value: Any) -> bool:
+    def _cacher(self, context: Dict[str, Any]) -> Optional[ub.Cacher]:
         """
-        Validate value is of type str_type
+        On-disk cache for symbols that opt in with ``cache: true``
+
+        The cache is keyed on the definition, the declared type, and the
+        values of the declared dependencies, so definitions must list every
+        symbol they read in ``depends_on``.
+
+        Example:
+            >>> from magnet.evaluation import Symbol
+            >>> spec = {'python': 'y = [x + 1]', 'depends_on': ['x'], 'cache': True}
+            >>> y1, y2 = Symbol('y', spec), Symbol('y', spec)
+            >>> c1, c2 = y1._cacher({'x': 1}), y2._cacher({'x': 1})
+            >>> assert c1.depends == c2.depends
+            >>> assert y1._cacher({'x': 2}).depends != c1.depends
         """
-        # TODO: static 'vocabulary' of allowable types / support more than List[Any], Dict[str, Any]
-        str_to_type = {'List': List, 'Dict': Dict, 'Tuple': Tuple, 'Any': Any}
-        type = eval(type_str, str_to_type)
-        return self._check_collections(type, value)
+        try:
+            depends = ub.hash_data([
+                self.definition,
+                self.type,
+                [(dep, context[dep]) for dep in self.dependencies],
+            ])
+        except (TypeError, KeyError) as ex:
+            logger.warning(f'Not caching symbol {self.name}: {ex!r}')
+            return None
+        dpath = ub.Path.appdir('magnet', 'symbols', type='cache')
+        return ub.Cacher(
+            f'symbol_{self.name}', depends=depends, dpath=dpath, verbose=0
+        )
+
+    def _check_type(self, value: Any) -> bool:
+        """
+        Validate value is of this symbol's declared type
+        """
+        target_type = self.parsed_type
+        if target_type is Any:
+            # Nothing to verify, skip walking the value
+            return True
+        return self._check_collections(target_type, value)
 
     def _check_collections(self, target_type: Any, value: Any) -> bool:
         """
-        Recursively evaluate if value is target_type
+        Evaluate if value is target_type, descending into nested collections
+
+        Example:
+            >>> from magnet.evaluation import Symbol
+            >>> from typing import Dict, List, Tuple
+            >>> x = Symbol('x', {})
+            >>> x._check_collections(Dict[str, List[int]], {'a': [1, 2]})
+            True
+            >>> x._check_collections(List[Tuple[int, str]], [(1, 'a'), (2, 3)])
+            False
         """
-        collection_type = get_origin(target_type)
-        members = get_args(target_type)
+        # Iterative traversal with an explicit stack of (type, value) pairs
+        stack = [(target_type, value)]
+        while stack:
+            target_type, value = stack.pop()
+            collection_type = get_origin(target_type)
+            members = get_args(target_type)
+
+            match collection_type:
+                case builtins.list:
+                    if not isinstance(value, list):
+                        return False
+                    member_type = members[0]
+                    if member_type is not Any:
+                        stack.extend((member_type, entry) for entry in value)
+                case builtins.dict:
+                    if not isinstance(value, dict):
+                        return False
+                    key_type, value_type = members
+                    if key_type is not Any:
+                        stack.extend((key_type, key) for key in value.keys())
+                    if value_type is not Any:
+                        stack.extend((value_type, val) for val in value.values())
+                case builtins.tuple:
+                    if not isinstance(value, tuple) or len(value) != len(members):
+                        return False
+                    stack.extend(zip(members, value))
+                case None:
+                    # Any or primative
+                    if target_type is not Any and not isinstance(value, target_type):
+                        return False
+                case _:
+                    return False
+        return True
+
+
+_IMMUTABLE_SCALAR_TYPES = (
+    type(None), bool, int, float, complex, str, bytes,
+)
+
+
+def _is_immutable_value(value: Any) -> bool:
+    """
+    True if ``value`` (and everything it contains) cannot be mutated
 
-        match collection_type:
-            case builtins.list:
-                if isinstance(value, list):
-                    return all(
-                        self._check_collections(members[0], entry)
-                        for entry in value
-                    )
-                return False
-            case builtins.dict:
-                if isinstance(value, dict):
-                    return all(
-                        self._check_collections(members[0], key_entry)
-                        and self._check_collections(members[1], value_entry)
-                        for key_entry, value_entry in value.items()
-                    )
-                return False
-            case builtins.tuple:
-                if isinstance(value, tuple) and len(value) == len(members):
-                    return all(
-                        self._check_collections(type, val)
-                        for type, val in zip(members, value)
-                    )
-                return False
-            case None:
-                # Any or primative
-                return target_type is Any or isinstance(value, target_type)
-            case _:
-                return False
+    Example:
+        >>> from magnet.evaluation import _is_immutable_value
+        >>> _is_immutable_value((1, 'a', frozenset({2.0})))
+        True
+        >>> _is_immutable_value((1, [2]))
+        False
+    """
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if type(value) in _IMMUTABLE_SCALAR_TYPES:
+            continue
+        if type(value) is tuple or type(value) is frozenset:
+            stack.extend(value)
+            continue
+        return False
+    return True
 
 
 class Symbols:
@@ -868,34 +1564,73 @@ class Symbols:
             symbol: Symbol(symbol, definition)
             for symbol, definition in symbol_specs.items()
         }
+        for symbol in self.symbols.values():
+            symbol._owner = self
+        self._resolution_order = None
+        self._values = None
 
     @classmethod
     def decompose_symbol_defs(
         cls, symbol_definitions: Dict[str, Any]
-    ) -> List[Self]:
+    ) -> Iterator[Self]:
         """
-        Flatten sweep values into a list of resolvable Symbols
+        Flatten sweep values into resolvable Symbols, one per sweep setting
+
+        Settings are generated lazily so large sweeps never need to be held
+        in memory all at once.
+
+        Example:
+            >>> from magnet.evaluation import Symbols
+            >>> rows = Symbols.decompose_symbol_defs({
+            ...     'a': {'sweep': [1, 2, 3]},
+            ...     'b': {'python': 'b = a * 2', 'depends_on': ['a']},
+            ... })
+            >>> first = next(rows)
+            >>> first()
+            {'a': 1, 'b': None}
+            >>> len(list(rows))
+            2
         """
-        configurations = []
-        aggregate_configuration = cls(symbol_definitions)
+        yield from cls(symbol_definitions).flatten()
 
-        sweep_symbols = aggregate_configuration._find_sweep_symbols()
+    def flatten(self) -> Iterator[Self]:
+        """
+        Lazily generate one resolvable copy of these Symbols per sweep setting
+        """
+        # Every row shares the same dependency graph, so sort it only once
+        # (rows copy the cached order from this aggregate)
+        self.resolution_order
+
+        sweep_symbols = self._find_sweep_symbols()
         if sweep_symbols:
+            sweep_names = [symbol.name for symbol in sweep_symbols]
             sweep_values = [sweep.sweep for sweep in sweep_symbols]
             combinations = product(*sweep_values)
 
+            # Symbols that do not depend on the sweep are identical in every
+            # row, so resolve them once and let the rows inherit the values.
+            self._resolve_invariant_symbols(sweep_names)
+
+            # Rows are cheap copies of the aggregate's Symbols that differ
+            # only in their swept values.
             for combo in combinations:
-                sweep_fill = dict(
-                    zip([symbol.name for symbol in sweep_symbols], combo)
-                )
-                flattened_symbols = cls(symbol_definitions)
-                for k, v in sweep_fill.items():
-                    flattened_symbols.symbols[k].value = v
-                configurations.append(flattened_symbols)
+                yield self._with_values(dict(zip(sweep_names, combo)))
         else:
-            configurations.append(aggregate_configuration)
+            yield self
 
-        return configurations
+    def _with_values(self, values: Dict[str, Any]) -> Self:
+        """
+        Copy of this collection with some symbol values filled in
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.symbols = {name: symbol.copy() for name, symbol in self.symbols.items()}
+        for symbol in new.symbols.values():
+            symbol._owner = new
+        new._values = None
+        for name, value in values.items():
+            new.symbols[name].value = value
+        return new
 
     def resolve(self) -> None:
         """
@@ -903,23 +1638,81 @@ class Symbols:
 
         Values stored in Symbol instances
         """
+        self._resolve(self.resolution_order)
+
+    def _resolve_invariant_symbols(self, varying: Iterable[str]) -> None:
+        """
+        Resolve only the symbols that do not (transitively) depend on any of
+        the ``varying`` symbols
+
+        Example:
+            >>> from magnet.evaluation import Symbols
+            >>> symbols = Symbols({
+            ...     'a': {'sweep': [1, 2]},
+            ...     'base': {'python': 'base = [10]'},
+            ...     'c': {'python': 'c = base + [a]', 'depends_on': ['a', 'base']},
+            ... })
+            >>> symbols._resolve_invariant_symbols(['a'])
+            >>> symbols()
+            {'a': None, 'base': None, 'c': None}
+            >>> symbols = Symbols({
+            ...     'a': {'sweep': [1, 2]},
+            ...     'base': {'type': 'Any', 'python': 'base = (10,)'},
+            ...     'n': {'type': 'int', 'python': 'n = len(base)', 'depends_on': ['base']},
+            ... })
+            >>> symbols._resolve_invariant_symbols(['a'])
+            >>> symbols()
+            {'a': None, 'base': (10,), 'n': 1}
+
+        Only immutable values are kept: flattened rows share these values,
+        so a mutable one (e.g. a list) could be changed by one row and seen
+        by the next. Mutable values computed here (and anything depending
+        on them) are reset and resolved again by every row; values given in
+        the spec are kept, and :func:`Symbol.copy` copies them per row.
+        """
+        varying = set(varying)
+        invariant = []
+        for name in self.resolution_order:
+            if name in varying or not varying.isdisjoint(
+                self.symbols[name].dependencies
+            ):
+                varying.add(name)
+            else:
+                invariant.append(name)
+        preset = {name for name in invariant if self.symbols[name].value is not None}
+        self._resolve(invariant)
+
+        shared = set()
+        for name in invariant:
+            symbol = self.symbols[name]
+            if name in preset or (
+                _is_immutable_value(symbol.value)
+                and shared.issuperset(symbol.dependencies)
+            ):
+                shared.add(name)
+            else:
+                symbol.value = None
+
+    def _resolve(self, order: Iterable[str]) -> None:
+        # A single namespace is shared by all definitions. The topological
+        # order guarantees dependencies are bound before they are used.
         symbol_definitions = {}
 
-        for symbol in self._construct_dependency_order():
+        for symbol in order:
             symbol_value = self.symbols[symbol]
-            symbol_definitions_ = symbol_definitions.copy()
             try:
                 symbol_definitions[symbol] = symbol_value.eval(
-                    symbol_definitions_
+                    symbol_definitions
                 )
             except Exception as ex:
+                resolved = ub.udict(symbol_definitions) - {'__builtins__'}
                 error_message = ub.codeblock(
                     f"""
                     Error in resolve. ex={ex}
 
                     {symbol=!r}
                     {symbol_value=!r}
-                    {symbol_definitions_=!r}
+                    {resolved=!r}
                     """
                 )
                 logger.error(error_message)
@@ -928,15 +1721,24 @@ class Symbols:
     def _find_sweep_symbols(self) -> List['Symbol']:
         return [symbol for symbol in self.symbols.values() if symbol.sweep]
 
+    @property
+    def resolution_order(self) -> Tuple[str, ...]:
+        """
+        Symbol names in dependency order (computed once and cached)
+        """
+        if self._resolution_order is None:
+            self._resolution_order = tuple(self._construct_dependency_order())
+        return self._resolution_order
+
     def _construct_dependency_order(self) -> List[str]:
         """
         Construct dependency order
         """
-        dependency_graph = {
-            name: symbol.dependencies for name, symbol in self.symbols.items()
-        }
-        sorter = TopologicalSorter(dependency_graph)
-        return list(sorter.static_order())
+        dependency_graph = tuple(
+            (name, tuple(symbol.dependencies))
+            for name, symbol in self.symbols.items()
+        )
+        return list(_topological_order(dependency_graph))
 
     def simple_view(self) -> Dict[str, Any]:
         # TODO: replace with free variables and data attestation
@@ -949,7 +1751,25 @@ class Symbols:
         }
 
     def __call__(self) -> Dict[str, Any]:
-        return {symbol: self.symbols[symbol].value for symbol in self.symbols}
+        """
+        Mapping of symbol names to their current values
+
+        The mapping is cached until a symbol value changes, so callers must
+        not modify it.
+
+        Example:
+            >>> from magnet.evaluation import Symbols
+            >>> symbols = Symbols({'x': {'value': 1}, 'y': {'value': 2}})
+            >>> assert symbols() is symbols()
+            >>> symbols.symbols['x'].value = 3
+            >>> symbols()
+            {'x': 3, 'y': 2}
+        """
+        if self._values is None:
+            self._values = {
+                name: symbol.value for name, symbol in self.symbols.items()
+            }
+        return self._values
 
 
 def main(argv: Optional[List[str]] = None, **kwargs: Any) -> None:
@@ -963,8 +1783,8 @@ def main(argv: Optional[List[str]] = None, **kwargs: Any) -> None:
 
     if args.validate == 'only':
         try:
-            with open(args.path, 'r') as f:
-                cfg = yaml.safe_load(f)
+            with open(args.path, 'rb') as f:
+                cfg = yaml.load(f, Loader=_YAML_LOADER)
             EvaluationCardSchema.model_validate(cfg)
             print('Card validation succeeded.')
         except ValidationError as e:
@@ -978,7 +1798,12 @@ def main(argv: Optional[List[str]] = None, **kwargs: Any) -> None:
     if args.override is not None:
         card.replace(args.override)
 
-    card.evaluate(jobs=args.jobs, parallel_backend=args.parallel_backend)
+    card.evaluate(
+        jobs=args.jobs,
+        parallel_backend=args.parallel_backend,
+        verbose=args.verbose,
+        fail_fast=args.fail_fast,
+    )
     card.summarize()
 
 
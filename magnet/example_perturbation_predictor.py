@@ -1,6 +1,7 @@
 import argparse
 
 from sklearn.linear_model import LinearRegression
+import numpy as np
 import pandas as pd
 
 from magnet.predictor import RunPredictor, RunPrediction
@@ -47,19 +48,25 @@ class ExamplePerturbationPredictor(RunPredictor):
         model.fit(train_run_spec_and_stats_df['stats.name.perturbation.prob'].values.reshape(-1, 1),
                   train_run_spec_and_stats_df['stats.mean'].values.reshape(-1, 1))
 
-        predictions = []
-
-        for _, row in eval_run_specs_df.iterrows():
-            run_spec_name = row['run_spec.name']
-            perturbations = row['run_spec.data_augmenter_spec.perturbation_specs']
+        run_spec_names = eval_run_specs_df['run_spec.name'].tolist()
+        perturbation_specs = eval_run_specs_df['run_spec.data_augmenter_spec.perturbation_specs'].tolist()
+        if not run_spec_names:
+            return []
 
+        misspelling_perturbation_probs = []
+        for perturbations in perturbation_specs:
             assert len(perturbations) > 0
-            misspelling_perturbation_prob = perturbations[0]['args']['prob']
+            misspelling_perturbation_probs.append(perturbations[0]['args']['prob'])
 
-            prediction = model.predict([[misspelling_perturbation_prob]])
-            # `model.predict` outputs a 2d numpy array, need to unpack the single value
-            prediction = prediction[0][0]
+        # Predict all eval runs in one call; `model.predict` outputs a 2d
+        # numpy array with a single column. Convert to Python floats once
+        # so the predictions do not carry NumPy scalars downstream.
+        all_predictions = model.predict(
+            np.asarray(misspelling_perturbation_probs, dtype=float).reshape(-1, 1))[:, 0].tolist()
 
+        predictions = []
+        for run_spec_name, misspelling_perturbation_prob, prediction in zip(
+                run_spec_names, misspelling_perturbation_probs, all_predictions):
             predictions.append(
                 RunPrediction(
                     run_spec_name=run_spec_name,
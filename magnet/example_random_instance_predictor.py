@@ -1,6 +1,7 @@
-import random
 import argparse
 
+import kwarray
+
 from magnet.instance_predictor import InstancePredictor, InstancePrediction
 from magnet.data_splits import TrainSplit, SequesteredTestSplit
 
@@ -29,13 +30,16 @@ class ExampleRandomInstancePredictor(InstancePredictor):
         eval_run_specs_df = sequestered_test_split.run_specs  # NOQA
         eval_scenario_state_df = sequestered_test_split.scenario_state
 
-        predictions = []
-        for _, row in eval_scenario_state_df.iterrows():
-            run_spec_name = row['run_spec.name']
-            instance_predict_id = row['magnet.instance_predict_id']
-
-            prediction = random.choice([0.0, 1.0])
+        # Draw every (0.0 or 1.0) prediction at once
+        rng = kwarray.ensure_rng(self.random_seed)
+        random_predictions = rng.randint(
+            0, 2, size=len(eval_scenario_state_df)).astype(float).tolist()
 
+        predictions = []
+        for run_spec_name, instance_predict_id, prediction in zip(
+                eval_scenario_state_df['run_spec.name'].tolist(),
+                eval_scenario_state_df['magnet.instance_predict_id'].tolist(),
+                random_predictions):
             predictions.append(
                 InstancePrediction(
                     run_spec_name=run_spec_name,
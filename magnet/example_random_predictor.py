@@ -1,6 +1,9 @@
-import random
 import argparse
 
+import kwarray
+import numpy as np
+import pandas as pd
+
 from magnet.predictor import RunPredictor, RunPrediction
 from magnet.data_splits import TrainSplit, SequesteredTestSplit
 
@@ -17,10 +20,18 @@ class ExampleRandomPredictor(RunPredictor):
         >>> predictor_instance = ExampleRandomPredictor(num_eval_samples=5)
         >>> predictor_instance(helm_suites=suite_path)
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Created once so repeated predict calls continue a single seeded
+        # stream instead of rebuilding the RNG and candidate values.
+        self._rng = kwarray.ensure_rng(self.random_seed)
+        # Predictions are multiples of 0.01 in [0, 1]
+        self._prediction_pool = np.arange(0, 101) / 100
+
     def predict(self,
                 train_split: TrainSplit,
                 sequestered_test_split: SequesteredTestSplit
-                ) -> list[RunPrediction]:
+                ) -> pd.DataFrame:
         # Unpack split classes into dataframes
         train_run_specs_df = train_split.run_specs  # NOQA
         train_scenario_states_df = train_split.scenario_state  # NOQA
@@ -29,18 +40,19 @@ class ExampleRandomPredictor(RunPredictor):
         eval_run_specs_df = sequestered_test_split.run_specs  # NOQA
         eval_scenario_state_df = sequestered_test_split.scenario_state
 
-        predictions = []
+        run_spec_names = eval_scenario_state_df['run_spec.name'].unique()
 
-        for key, _ in eval_scenario_state_df.groupby(['run_spec.name']):
-            run_spec_name, = key
-            prediction = (random.choice(range(0, 101)) / 100)
+        # Draw every prediction at once
+        random_predictions = self._rng.choice(
+            self._prediction_pool, size=len(run_spec_names))
 
-            predictions.append(
-                RunPrediction(
-                    run_spec_name=run_spec_name,
-                    split="valid",
-                    stat_name="exact_match",
-                    mean=prediction))
+        # Tabulate the predictions directly rather than building one
+        # RunPrediction object per run
+        predictions = RunPrediction.frame(
+            run_spec_names,
+            split="valid",
+            stat_name="exact_match",
+            means=random_predictions.tolist())
 
         return predictions
 
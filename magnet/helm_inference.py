@@ -1,16 +1,56 @@
 import contextlib
 import os
+import sys
+from collections import OrderedDict
+from typing import List
 
 from helm.common.request import Request
 from helm.common.request import RequestResult, GeneratedOutput
 from helm.common.authentication import Authentication
-from helm.benchmark.executor import ExecutionSpec, Executor, ExecutorError
-from helm.benchmark.config_registry import (
-    # register_configs_from_directory,
-    register_builtin_configs_from_helm_package,
-)
+from helm.benchmark.executor import ExecutorError
 from helm.common.hierarchical_logger import hwarn
-from helm.clients.huggingface_client import HuggingFaceServerFactory
+
+from magnet.backends.helm.util.helm_registry import ensure_builtin_configs_registered
+
+
+@contextlib.contextmanager
+def _suppress_stdout():
+    """
+    Silence stdout at the file descriptor level, which also covers output
+    written by C extensions and subprocesses that bypass ``sys.stdout``.
+
+    Falls back to redirecting ``sys.stdout`` when it is not backed by a real
+    file descriptor (e.g. when captured by pytest or a notebook).
+
+    Example:
+        >>> from magnet.helm_inference import _suppress_stdout
+        >>> with _suppress_stdout():
+        ...     print('not shown')
+        >>> print('shown')
+        shown
+    """
+    try:
+        stdout_fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        stdout_fd = None
+
+    if stdout_fd is None:
+        with open(os.devnull, 'w') as devnull:
+            with contextlib.redirect_stdout(devnull):
+                yield
+        return
+
+    sys.stdout.flush()
+    saved_fd = os.dup(stdout_fd)
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull_fd, stdout_fd)
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved_fd, stdout_fd)
+        os.close(saved_fd)
+        os.close(devnull_fd)
 
 
 class HelmInferenceEngine:
@@ -35,6 +75,9 @@ class HelmInferenceEngine:
         >>>                   num_completions=1,
         >>>                   max_tokens=10)
         >>> response = self.inference_request(request)
+        >>> # Deterministic requests are answered from an in-memory cache
+        >>> assert self.inference_request(request) is response
+        >>> assert self.batch_inference_request([request, request]) == [response, response]
         >>> response = replace(response, request_time=None, request_datetime=None)
         >>> print(response)
         RequestResult(success=True, embedding=[], completions=[GeneratedOutput(text='\n\nThe answer is yes. The moon is', logprob=0.0, tokens=...
@@ -48,10 +91,20 @@ class HelmInferenceEngine:
         )
     """
 
+    # Maximum number of deterministic request results kept in memory
+    _RESULT_CACHE_SIZE = 1024
+
+    # Executors are shared by engines built from equal execution specs
+    _executor_cache = {}
+
     def __init__(self, execution_spec=None):
-        # Not sure this is the best place to do this, or if it's
-        # idempotent
-        register_builtin_configs_from_helm_package()
+        # HELM's registration is not idempotent, so go through the
+        # process-wide guard rather than registering per engine.
+        ensure_builtin_configs_registered()
+
+        # Deferred so importing this module does not pull in the model
+        # clients (and torch / transformers) until an engine is built.
+        from helm.benchmark.executor import ExecutionSpec, Executor
 
         if execution_spec is None:
             auth = Authentication("")
@@ -71,12 +124,114 @@ class HelmInferenceEngine:
                 sqlite_cache_backend_config=sqlite_cache_backend_config,
                 mongo_cache_backend_config=mongo_cache_backend_config)
 
-        with open(os.devnull, 'w') as devnull:
-            with contextlib.redirect_stdout(devnull):
+        # ExecutionSpec may hold unhashable cache configs, but its repr
+        # covers every field.
+        executor_key = repr(execution_spec)
+        executor = HelmInferenceEngine._executor_cache.get(executor_key, None)
+        if executor is None:
+            with _suppress_stdout():
                 # Intended to suppress the 'Looking in path: prod_env' message
-                self.executor = Executor(execution_spec)
+                executor = Executor(execution_spec)
+            HelmInferenceEngine._executor_cache[executor_key] = executor
+        self.executor = executor
+
+        self._result_cache = OrderedDict()
 
     def inference_request(self, request: Request) -> RequestResult:
+        cache_key = self._cache_key(request)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key, None)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached
+
+        result = self._execute_request(request)
+        self._cache_result(cache_key, result)
+        return result
+
+    def batch_inference_request(self, requests: List[Request]) -> List[RequestResult]:
+        """
+        Execute several requests, returning results in the same order.
+
+        Identical deterministic requests are executed once, cached results
+        are reused, and the remaining requests are dispatched with HELM's
+        ``parallel_map`` using the execution spec's parallelism.
+
+        Args:
+            requests (List[Request]): the requests to run
+
+        Returns:
+            List[RequestResult]
+        """
+        cache_keys = [self._cache_key(request) for request in requests]
+        results = [None] * len(requests)
+
+        # Map each distinct pending request to the output slots it fills
+        pending_requests = []
+        pending_slots = []
+        slots_by_key = {}
+        for index, (request, cache_key) in enumerate(zip(requests, cache_keys)):
+            if cache_key is not None:
+                cached = self._result_cache.get(cache_key, None)
+                if cached is not None:
+                    self._result_cache.move_to_end(cache_key)
+                    results[index] = cached
+                    continue
+                if cache_key in slots_by_key:
+                    slots_by_key[cache_key].append(index)
+                    continue
+                slots_by_key[cache_key] = slots = []
+            else:
+                slots = []
+            slots.append(index)
+            pending_requests.append(request)
+            pending_slots.append(slots)
+
+        if pending_requests:
+            from helm.common.general import parallel_map
+            parallelism = self.executor.execution_spec.parallelism
+            pending_results = parallel_map(
+                self._execute_request, pending_requests,
+                parallelism=parallelism)
+            for slots, result in zip(pending_slots, pending_results):
+                self._cache_result(cache_keys[slots[0]], result)
+                for index in slots:
+                    results[index] = result
+        return results
+
+    @staticmethod
+    def _cache_key(request: Request):
+        # Only greedy (temperature 0) requests are deterministic, so only
+        # those are safe to answer from the cache. Request holds lists and
+        # is not hashable, but its repr covers every field.
+        if request.temperature == 0:
+            return repr(request)
+        return None
+
+    def _cache_result(self, cache_key, result: RequestResult) -> None:
+        """
+        Example:
+            >>> from magnet.helm_inference import HelmInferenceEngine
+            >>> from collections import OrderedDict
+            >>> from helm.common.request import RequestResult
+            >>> self = HelmInferenceEngine.__new__(HelmInferenceEngine)
+            >>> self._result_cache = OrderedDict()
+            >>> failed = RequestResult(success=False, embedding=[], completions=[], cached=False, error='timeout')
+            >>> ok = RequestResult(success=True, embedding=[], completions=[], cached=False)
+            >>> self._cache_result('failed', failed)
+            >>> self._cache_result('ok', ok)
+            >>> list(self._result_cache)
+            ['ok']
+        """
+        # Non-fatal errors come back as empty completions; do not replay a
+        # transient backend failure for every later identical request.
+        if cache_key is None or not result.success or result.error:
+            return
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _execute_request(self, request: Request) -> RequestResult:
         # Largely copied (with a few tweaks to remove the RequestState
         # container) from the Executor.process method in HELM (
         # https://github.com/stanford-crfm/helm/blob/v0.5.8/src/helm/benchmark/executor.py#L111)
@@ -94,6 +249,7 @@ class HelmInferenceEngine:
 
     @staticmethod
     def get_loaded_model(model_name):
+        from helm.clients.huggingface_client import HuggingFaceServerFactory
         server = HuggingFaceServerFactory._servers.get(model_name)
 
         if server is not None:
@@ -30,7 +30,7 @@ class InstancePrediction:
         self.sum_squared = sum_squared
 
         if self.sum_squared is None and self.sum is not None:
-            self.sum_squared = self.sum ** 2
+            self.sum_squared = self.sum * self.sum
 
         self.min = min
         self.max = max
@@ -8,12 +8,12 @@ from helm.benchmark.run_expander import PERTURBATION_SPECS_DICT
 from helm.benchmark.augmentations.perturbation import (
     create_perturbation,
 )
-import dacite
 from helm.benchmark.scenarios.scenario import (
     Instance,
     with_instance_ids,
 )
 import ubelt as ub
+from magnet.utils.util_dataclass import dataclass_from_dict_factory
 
 
 def main():
@@ -50,7 +50,8 @@ def apply_perturbations(instances_filepath: str,
     with open(instances_filepath) as f:
         json_instances: List[Dict[str, Any]] = json.load(f)
 
-    input_instances = [dacite.from_dict(Instance, instance) for instance in json_instances]
+    make_instance = dataclass_from_dict_factory(Instance)
+    input_instances = [make_instance(instance) for instance in json_instances]
 
     # For some reason the original caching out of instances from
     # runner doesn't include instance IDs, so we need to add them if
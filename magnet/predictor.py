@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 import rich
@@ -197,7 +198,7 @@ class RunPrediction:
         self.sum_squared = sum_squared
 
         if self.sum_squared is None and self.sum is not None:
-            self.sum_squared = self.sum ** 2
+            self.sum_squared = self.sum * self.sum
 
         self.min = min
         self.max = max
@@ -207,6 +208,29 @@ class RunPrediction:
 
     @classmethod
     def to_df(cls, instance_predictions):
+        """
+        Args:
+            instance_predictions (List[RunPrediction] | pd.DataFrame):
+                predictions to tabulate. A DataFrame (e.g. one built with
+                :meth:`RunPrediction.frame`) is assumed to already be in
+                this layout and is returned as-is.
+
+        Example:
+            >>> from magnet.predictor import RunPrediction
+            >>> predictions = [
+            ...     RunPrediction('run1', 'valid', 'exact_match', 0.5,
+            ...                   perturbation_parameters={'name': 'typos', 'prob': 0.1}),
+            ...     RunPrediction('run2', 'valid', 'exact_match', 0.25),
+            ... ]
+            >>> df = RunPrediction.to_df(predictions)
+            >>> df['stats.name.perturbation.name'].tolist()
+            ['typos', None]
+            >>> df['stats.name.perturbation.prob'].tolist()
+            [0.1, nan]
+        """
+        if isinstance(instance_predictions, pd.DataFrame):
+            return instance_predictions
+
         df = pd.DataFrame([
             {
                 'run_spec.name': p.run_spec_name,
@@ -221,12 +245,69 @@ class RunPrediction:
                 'stats.sum_squared': p.sum_squared,
                 'stats.variance': p.variance,
                 'stats.name.perturbation.computed_on': p.computed_on,
-                **{'stats.name.perturbation.{}'.format(k): v for k, v in p.perturbation_parameters.items()}
+                **dict(zip(_perturbation_columns(tuple(p.perturbation_parameters)),
+                           p.perturbation_parameters.values()))
             }
             for p in instance_predictions])
 
         return df
 
+    @classmethod
+    def frame(cls, run_spec_names, split, stat_name, means):
+        """
+        Build the :meth:`RunPrediction.to_df` table directly from columns.
+
+        Avoids constructing one :class:`RunPrediction` per row when every
+        prediction shares the same split, stat name, and default fields.
+
+        Args:
+            run_spec_names (Sequence[str]): one run spec name per prediction
+            split (str): split shared by all predictions
+            stat_name (str): stat name shared by all predictions
+            means (Sequence[float]): one predicted mean per prediction
+
+        Returns:
+            pd.DataFrame
+
+        Example:
+            >>> from magnet.predictor import RunPrediction
+            >>> names, means = ['run1', 'run2'], [0.5, 0.25]
+            >>> df = RunPrediction.frame(names, 'valid', 'exact_match', means)
+            >>> expected = RunPrediction.to_df([
+            ...     RunPrediction(n, 'valid', 'exact_match', m)
+            ...     for n, m in zip(names, means)])
+            >>> import pandas as pd
+            >>> pd.testing.assert_frame_equal(df, expected)
+            >>> assert RunPrediction.to_df(df) is df
+        """
+        num = len(run_spec_names)
+        perturbation_defaults = {"name": None, "fairness": None, "robustness": None}
+        columns = {
+            'run_spec.name': list(run_spec_names),
+            'stats.name.split': [split] * num,
+            'stats.count': [1] * num,
+            'stats.max': [None] * num,
+            'stats.mean': list(means),
+            'stats.min': [None] * num,
+            'stats.name.name': [stat_name] * num,
+            'stats.stddev': [0.0] * num,
+            'stats.sum': [None] * num,
+            'stats.sum_squared': [None] * num,
+            'stats.variance': [0.0] * num,
+            'stats.name.perturbation.computed_on': [None] * num,
+            **{col: [value] * num for col, value in zip(
+                _perturbation_columns(tuple(perturbation_defaults)),
+                perturbation_defaults.values())}
+        }
+        return pd.DataFrame(columns)
+
+
+@lru_cache(maxsize=None)
+def _perturbation_columns(keys):
+    # Predictions nearly always share the same perturbation parameter keys,
+    # so the column names are formatted once per distinct key set.
+    return tuple(f'stats.name.perturbation.{k}' for k in keys)
+
 
 class RunPredictor(Predictor):
     def compare_predicted_to_actual(self, predicted_stats_df, eval_stats_df):
@@ -266,7 +347,7 @@ class RunPredictor(Predictor):
 
     def predict(self,
                 train_split,
-                sequestered_test_split) -> list[RunPrediction]:
+                sequestered_test_split) -> list[RunPrediction] | pd.DataFrame:
         raise NotImplementedError
 
     def _evaluate(self, helm_runs=None):
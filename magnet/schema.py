@@ -12,7 +12,16 @@ class SubmitterSchema(BaseModel):
 
 # TODO: this can be validated with a syntax check
 class ClaimSchema(BaseModel):
-    python: str
+    python: str | None = None
+    expression: str | None = None
+
+    @model_validator(mode='after')
+    def has_exactly_one_form(self) -> 'ClaimSchema':
+        if (self.python is None) == (self.expression is None):
+            raise ValueError(
+                "claim must define exactly one of: 'python' or 'expression'"
+            )
+        return self
 
 class SymbolSchema(BaseModel):
     type: str | None = None
@@ -20,6 +29,7 @@ class SymbolSchema(BaseModel):
     sweep: list | None = None
     depends_on: list[str] = Field(default_factory=list) # TODO: modify "depends_on" to reference an actual symbol
     python: str | None = None # TODO: this can be validated with a syntax check
+    cache: bool = False
 
     @model_validator(mode='after')
     def has_resolution(self) -> 'SymbolSchema':
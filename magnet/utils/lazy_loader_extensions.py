@@ -66,7 +66,6 @@ from __future__ import annotations
 import importlib
 import importlib.abc
 import importlib.util
-import inspect
 import sys
 import warnings
 from typing import Any, Mapping, Optional, Sequence, Tuple, Type
@@ -74,11 +73,34 @@ import lazy_loader
 
 
 def _property_names(cls: Type) -> set[str]:
-    """Return names of @property descriptors declared on a class."""
+    """
+    Return names of @property descriptors declared on a class.
+
+    Scans the class namespaces directly (most derived definition wins)
+    instead of :func:`inspect.getmembers`, which getattr's and sorts every
+    attribute.
+
+    Example:
+        >>> from magnet.utils.lazy_loader_extensions import _property_names
+        >>> class Base:
+        ...     @property
+        ...     def a(self): ...
+        ...     @property
+        ...     def b(self): ...
+        >>> class Child(Base):
+        ...     b = 1
+        ...     @property
+        ...     def c(self): ...
+        >>> sorted(_property_names(Child))
+        ['a', 'c']
+    """
     names: set[str] = set()
-    for name, obj in inspect.getmembers(cls):
-        if isinstance(obj, property):
-            names.add(name)
+    for klass in reversed(cls.__mro__):
+        for name, obj in vars(klass).items():
+            if isinstance(obj, property):
+                names.add(name)
+            else:
+                names.discard(name)
     return names
 # ... existing imports ...
 
@@ -0,0 +1,304 @@
+"""
+Fast construction of (nested) dataclasses from plain dictionaries.
+
+:func:`dacite.from_dict` walks the type hints of every field for every
+object it builds. When thousands of objects share one schema (e.g. the
+instances in a HELM ``instances.json`` or the request states in a
+``scenario_state.json``) it is much cheaper to inspect the schema once and
+generate a specialized constructor for it, which is what this module does.
+"""
+import collections.abc
+import dataclasses
+import itertools
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import dacite
+
+# Generated factories share one namespace so they can refer to each other
+# (and to themselves, for recursive schemas) by name. A class only appears in
+# _FACTORY_NAMES once its factory (and every factory it calls) is defined;
+# names of factories still being generated live in _PENDING_NAMES.
+_FACTORY_NAMESPACE: Dict[str, Any] = {
+    'DaciteFieldError': dacite.DaciteFieldError,
+    'MissingValueError': dacite.MissingValueError,
+}
+_FACTORY_NAMES: Dict[Type, str] = {}
+_PENDING_NAMES: Dict[Type, str] = {}
+_FACTORY_COUNTER = itertools.count()
+_FACTORY_LOCK = threading.RLock()
+
+_NoneType = type(None)
+_LIST_ORIGINS = {
+    list, collections.abc.Sequence, collections.abc.MutableSequence,
+}
+_DICT_ORIGINS = {
+    dict, collections.abc.Mapping, collections.abc.MutableMapping,
+}
+
+
+class _Unsupported(Exception):
+    """
+    Raised while generating code for a type we do not know how to build
+    """
+
+
+def dataclass_from_dict_factory(cls: Type) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build (or lookup) a specialized ``dict -> cls`` constructor.
+
+    The returned function behaves like ``dacite.from_dict(cls, data)``
+    without type checking: nested dataclasses (including those inside
+    ``Optional``, ``List``, ``Tuple``, and ``Dict`` annotations) are
+    constructed recursively, missing keys fall back to field defaults, and
+    missing ``Optional`` fields without defaults become None. Classes with
+    field annotations this does not understand (e.g. unions of several
+    dataclasses) fall back to :func:`dacite.from_dict`.
+
+    Args:
+        cls (Type): a dataclass type
+
+    Returns:
+        Callable: a function that maps a dictionary to an instance of ``cls``
+
+    Example:
+        >>> from magnet.utils.util_dataclass import *  # NOQA
+        >>> import dataclasses, typing
+        >>> @dataclasses.dataclass(frozen=True)
+        ... class Output:
+        ...     text: str = ''
+        ...
+        >>> @dataclasses.dataclass(frozen=True)
+        ... class Reference:
+        ...     output: Output
+        ...     tags: typing.List[str]
+        ...
+        >>> @dataclasses.dataclass(frozen=True)
+        ... class Instance:
+        ...     references: typing.List[Reference]
+        ...     split: typing.Optional[str] = None
+        ...     contrast: typing.Optional[typing.List[Output]] = None
+        ...     shape: typing.Tuple[int, ...] = ()
+        ...
+        >>> make = dataclass_from_dict_factory(Instance)
+        >>> data = {
+        ...     'references': [{'output': {'text': 'a'}, 'tags': ['correct']}],
+        ...     'shape': [2, 3],
+        ...     'unknown_key': 'ignored',
+        ... }
+        >>> make(data)
+        Instance(references=[Reference(output=Output(text='a'), tags=['correct'])], split=None, contrast=None, shape=(2, 3))
+        >>> make(data) == dacite.from_dict(Instance, data, config=dacite.Config(cast=[tuple]))
+        True
+        >>> assert dataclass_from_dict_factory(Instance) is make
+    """
+    name = _FACTORY_NAMES.get(cls, None)
+    if name is None:
+        with _FACTORY_LOCK:
+            name = _FACTORY_NAMES.get(cls, None)
+            if name is None:
+                name = _generate_and_publish(cls)
+    return _FACTORY_NAMESPACE[name]
+
+
+def dataclass_from_dict(cls: Type, data: Dict[str, Any]) -> Any:
+    """
+    Construct ``cls`` from ``data`` with a cached generated factory.
+
+    Example:
+        >>> from magnet.utils.util_dataclass import *  # NOQA
+        >>> from helm.benchmark.metrics.statistic import Stat
+        >>> stat = dataclass_from_dict(Stat, {'name': {'name': 'exact_match', 'split': 'test'}, 'count': 1, 'sum': 1.0})
+        >>> stat.name.split, stat.count
+        ('test', 1)
+    """
+    return dataclass_from_dict_factory(cls)(data)
+
+
+def _generate_and_publish(cls: Type) -> str:
+    """
+    Generate the factory for ``cls`` and any nested dataclasses it needs,
+    then publish them all at once. Must be called with _FACTORY_LOCK held.
+
+    Example:
+        >>> from magnet.utils.util_dataclass import *  # NOQA
+        >>> from magnet.utils.util_dataclass import _FACTORY_NAMES, _PENDING_NAMES
+        >>> import dataclasses
+        >>> @dataclasses.dataclass
+        ... class Broken:
+        ...     value: 'UndefinedType'
+        ...
+        >>> @dataclasses.dataclass
+        ... class Outer:
+        ...     inner: Broken
+        ...
+        >>> import pytest
+        >>> with pytest.raises(NameError):
+        ...     dataclass_from_dict_factory(Outer)
+        >>> assert Outer not in _FACTORY_NAMES and Broken not in _FACTORY_NAMES
+        >>> assert not _PENDING_NAMES
+    """
+    try:
+        name = _generate_factory(cls)
+    except Exception:
+        for pending_name in _PENDING_NAMES.values():
+            _FACTORY_NAMESPACE.pop(pending_name, None)
+            _FACTORY_NAMESPACE.pop(f'{pending_name}_cls', None)
+        raise
+    else:
+        _FACTORY_NAMES.update(_PENDING_NAMES)
+    finally:
+        _PENDING_NAMES.clear()
+    return name
+
+
+def _lookup_factory_name(cls: Type) -> Union[str, None]:
+    name = _FACTORY_NAMES.get(cls, None)
+    if name is None:
+        name = _PENDING_NAMES.get(cls, None)
+    return name
+
+
+def _generate_factory(cls: Type) -> str:
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f'{cls} is not a dataclass')
+
+    name = f'_make_{cls.__name__}_{next(_FACTORY_COUNTER)}'
+    # Reserve the name before generating the body so recursive references
+    # resolve to this factory.
+    _PENDING_NAMES[cls] = name
+    cls_name = f'{name}_cls'
+    _FACTORY_NAMESPACE[cls_name] = cls
+
+    try:
+        hints = get_type_hints(cls)
+        lines = [f'def {name}(d):', '    kw = {}']
+        for field in dataclasses.fields(cls):
+            if not field.init:
+                continue
+            key = repr(field.name)
+            has_default = (field.default is not dataclasses.MISSING or
+                           field.default_factory is not dataclasses.MISSING)
+            field_type = hints.get(field.name, field.type)
+            expr = _convert_expr(field_type, 'v', 0)
+            if expr is None:
+                expr = 'v'
+            if has_default:
+                lines.append(f'    if {key} in d:')
+                lines.append(f'        v = d[{key}]')
+                lines.extend(_assign_lines(key, expr, '        '))
+            elif _is_optional(field_type):
+                lines.append(f'    v = d.get({key}, None)')
+                lines.extend(_assign_lines(key, f'None if v is None else {expr}', '    '))
+            else:
+                # Report missing keys the same way dacite does
+                lines.append('    try:')
+                lines.append(f'        v = d[{key}]')
+                lines.append('    except KeyError:')
+                lines.append(f'        raise MissingValueError({key}) from None')
+                lines.extend(_assign_lines(key, expr, '    '))
+        lines.append(f'    return {cls_name}(**kw)')
+        source = '\n'.join(lines)
+        code = compile(source, f'<dataclass_factory:{cls.__qualname__}>', 'exec')
+        exec(code, _FACTORY_NAMESPACE)
+    except _Unsupported:
+        _FACTORY_NAMESPACE[name] = _dacite_factory(cls)
+    return name
+
+
+def _assign_lines(key: str, expr: str, indent: str) -> list:
+    """
+    Source lines that store ``expr`` as field ``key``, prefixing the field
+    path of errors raised while building nested dataclasses (like dacite).
+    """
+    if expr == 'v':
+        return [f'{indent}kw[{key}] = v']
+    return [
+        f'{indent}try:',
+        f'{indent}    kw[{key}] = {expr}',
+        f'{indent}except DaciteFieldError as ex:',
+        f'{indent}    ex.update_path({key})',
+        f'{indent}    raise',
+    ]
+
+
+def _dacite_factory(cls: Type) -> Callable[[Dict[str, Any]], Any]:
+    def _make(d):
+        return dacite.from_dict(cls, d)
+    return _make
+
+
+def _is_optional(tp: Any) -> bool:
+    return get_origin(tp) is Union and _NoneType in get_args(tp)
+
+
+def _contains_dataclass(tp: Any) -> bool:
+    if dataclasses.is_dataclass(tp):
+        return True
+    return any(_contains_dataclass(arg) for arg in get_args(tp))
+
+
+def _convert_expr(tp: Any, var: str, depth: int) -> Union[str, None]:
+    """
+    Return a source expression that converts ``var`` to ``tp``, or None if
+    the value can be used as-is.
+    """
+    if dataclasses.is_dataclass(tp) and isinstance(tp, type):
+        name = _lookup_factory_name(tp)
+        if name is None:
+            name = _generate_factory(tp)
+        return f'{name}({var})'
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Union:
+        members = [a for a in args if a is not _NoneType]
+        if len(members) == 1:
+            inner = _convert_expr(members[0], var, depth)
+            if inner is None:
+                return None
+            return f'(None if {var} is None else {inner})'
+        if _contains_dataclass(tp):
+            raise _Unsupported(tp)
+        return None
+
+    elem = f'e{depth}'
+    if origin in _LIST_ORIGINS:
+        inner = _convert_expr(args[0], elem, depth + 1) if args else None
+        if inner is None:
+            return None
+        return f'[{inner} for {elem} in {var}]'
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            inner = _convert_expr(args[0], elem, depth + 1)
+            if inner is None:
+                return f'tuple({var})'
+            return f'tuple({inner} for {elem} in {var})'
+        if _contains_dataclass(tp):
+            raise _Unsupported(tp)
+        return f'tuple({var})'
+
+    if origin in _DICT_ORIGINS:
+        if len(args) == 2:
+            if _contains_dataclass(args[0]):
+                raise _Unsupported(tp)
+            inner = _convert_expr(args[1], elem, depth + 1)
+            if inner is not None:
+                key = f'k{depth}'
+                return f'{{{key}: {inner} for {key}, {elem} in {var}.items()}}'
+        return None
+
+    if _contains_dataclass(tp):
+        raise _Unsupported(tp)
+    return None
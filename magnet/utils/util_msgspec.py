@@ -62,6 +62,9 @@ class MsgspecRegistry:
 
     def __init__(self):
         self.cache: Dict[Type, Type] = {}  # dataclass -> struct
+        # Decoders compile their type once, so keep one per target type
+        self._decoders: Dict[Any, msgspec.json.Decoder] = {}
+        self._msgpack_decoders: Dict[Any, msgspec.msgpack.Decoder] = {}
 
     def __getitem__(self, key):
         return self.cache[key]
@@ -121,8 +124,54 @@ class MsgspecRegistry:
         return obj
 
     def decode(self, data: bytes, cls) -> Any:
-        """Load the msgspec results"""
-        decoder = msgspec.json.Decoder(cls)
+        """
+        Load the msgspec results
+
+        Example:
+            >>> from magnet.utils.util_msgspec import *  # NOQA
+            >>> import dataclasses
+            >>> @dataclasses.dataclass
+            ... class Point:
+            ...     x: int
+            ...     y: int
+            ...
+            >>> reg = MsgspecRegistry()
+            >>> PointStruct = reg.register(Point)
+            >>> reg.decode(b'[{"x": 1, "y": 2}]', list[PointStruct])
+            [Point(x=1, y=2)]
+            >>> assert len(reg._decoders) == 1
+            >>> reg.decode(b'[]', list[PointStruct])
+            []
+            >>> assert len(reg._decoders) == 1, 'decoder should be reused'
+        """
+        decoder = self._decoders.get(cls, None)
+        if decoder is None:
+            decoder = self._decoders[cls] = msgspec.json.Decoder(cls)
+        struct_obj = decoder.decode(data)
+        return struct_obj
+
+    def decode_msgpack(self, data: bytes, cls) -> Any:
+        """
+        Load msgspec results from msgpack bytes
+
+        Example:
+            >>> from magnet.utils.util_msgspec import *  # NOQA
+            >>> import dataclasses
+            >>> @dataclasses.dataclass
+            ... class Point:
+            ...     x: int
+            ...     y: int
+            ...
+            >>> reg = MsgspecRegistry()
+            >>> PointStruct = reg.register(Point)
+            >>> points = reg.decode(b'[{"x": 1, "y": 2}]', list[PointStruct])
+            >>> data = msgspec.msgpack.encode(points)
+            >>> reg.decode_msgpack(data, list[PointStruct]) == points
+            True
+        """
+        decoder = self._msgpack_decoders.get(cls, None)
+        if decoder is None:
+            decoder = self._msgpack_decoders[cls] = msgspec.msgpack.Decoder(cls)
         struct_obj = decoder.decode(data)
         return struct_obj
 
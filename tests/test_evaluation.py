@@ -0,0 +1,143 @@
+import itertools
+
+import pytest
+import yaml
+
+from magnet.evaluation import (
+    Claim,
+    EvaluationCard,
+    Symbols,
+    _vectorized_claim_outcomes,
+)
+
+
+def _per_setting_outcomes(claim, symbols):
+    """
+    Evaluate the claim the slow way, once per flattened sweep setting
+    """
+    outcomes = []
+    for row in symbols.flatten():
+        row.resolve()
+        status, _ = Claim({claim.key: claim.claim}).evaluate(dict(row()))
+        outcomes.append(status == 'VERIFIED')
+    return outcomes
+
+
+@pytest.mark.parametrize('claim_spec, sweeps', [
+    pytest.param(
+        {'python': 'assert x * y * z < 0'},
+        {'x': [2 ** 31 - 1, 1], 'y': [2 ** 31 - 1, 1], 'z': [4, 2]},
+        id='int64-overflow',
+    ),
+    pytest.param(
+        {'expression': 'x * x * x * x == 2 ** 64'},
+        {'x': [2 ** 16, 3]},
+        id='int64-wraparound-to-zero',
+    ),
+    pytest.param(
+        {'expression': 'x < 0.5'},
+        {'x': [2 ** 60 + 1, 0]},
+        id='int-to-float-conversion',
+    ),
+    pytest.param(
+        {'expression': 'x * y - 3 >= x // 2'},
+        {'x': [-7, 0, 5], 'y': [1.5, 2, -3]},
+        id='small-mixed-values',
+    ),
+])
+def test_vectorized_outcomes_match_per_setting(claim_spec, sweeps):
+    symbols = Symbols({name: {'sweep': values} for name, values in sweeps.items()})
+    claim = Claim(claim_spec)
+    expected = _per_setting_outcomes(claim, symbols)
+    outcomes = _vectorized_claim_outcomes(claim, symbols)
+    assert outcomes is None or outcomes == expected
+
+
+def test_vectorized_outcomes_numexpr_overflow():
+    # Large enough to take the numexpr branch
+    values = list(range(2 ** 31 - 256, 2 ** 31))
+    symbols = Symbols({'x': {'sweep': values}, 'y': {'sweep': values}})
+    claim = Claim({'expression': 'x * y * 4 < 0'})
+    outcomes = _vectorized_claim_outcomes(claim, symbols)
+    assert outcomes is None or not any(outcomes)
+
+
+def test_vectorized_outcomes_numexpr_small_values():
+    values = list(range(256))
+    symbols = Symbols({'x': {'sweep': values}, 'y': {'sweep': values}})
+    claim = Claim({'expression': 'x * y - x < 100'})
+    outcomes = _vectorized_claim_outcomes(claim, symbols)
+    expected = [x * y - x < 100 for x, y in itertools.product(values, values)]
+    assert outcomes == expected
+
+
+@pytest.mark.parametrize('claim_spec', [
+    pytest.param({'expression': 'hash(x) == x'}, id='hash'),
+    pytest.param({'expression': 'next(iter([x])) == x'}, id='iter'),
+    pytest.param({'expression': '[x, 2][slice(1)] == [x]'}, id='slice'),
+    pytest.param({'python': 'class Box:\n    value = x\nassert Box.value == x'}, id='class'),
+    pytest.param({'python': 'try:\n    x.missing\nexcept AttributeError:\n    pass'}, id='exception-name'),
+])
+def test_claims_see_all_builtins(claim_spec):
+    status, message = Claim(claim_spec).evaluate({'x': 1})
+    assert status == 'VERIFIED', message
+
+
+def test_claim_evaluate_leaves_symbols_untouched():
+    symbols = {'x': 1}
+    status, _ = Claim({'python': 'y = x + 1\nassert y == 2'}).evaluate(symbols)
+    assert status == 'VERIFIED'
+    assert symbols == {'x': 1}
+    status, _ = Claim({'expression': 'True'}).evaluate()
+    assert status == 'VERIFIED'
+
+
+def test_flattened_rows_do_not_share_mutable_invariants():
+    symbols = Symbols({
+        'a': {'type': 'int', 'sweep': [1, 2, 3]},
+        'base': {'python': 'base = [10]'},
+        'c': {'python': 'base.append(a)\nc = list(base)', 'depends_on': ['a', 'base']},
+    })
+    values = []
+    for row in symbols.flatten():
+        row.resolve()
+        values.append(row()['c'])
+    assert values == [[10, 1], [10, 2], [10, 3]]
+
+
+def test_flattened_rows_do_not_share_mutable_values():
+    symbols = Symbols({
+        'a': {'type': 'int', 'sweep': [1, 2, 3]},
+        'base': {'value': [10]},
+        'c': {'python': 'base.append(a)\nc = list(base)', 'depends_on': ['a', 'base']},
+    })
+    values = []
+    for row in symbols.flatten():
+        row.resolve()
+        values.append(row()['c'])
+    assert values == [[10, 1], [10, 2], [10, 3]]
+    assert symbols()['base'] == [10]
+
+
+def test_symbol_definitions_do_not_leak_rebound_names():
+    symbols = Symbols({
+        'a': {'type': 'int', 'value': 1},
+        'b': {'type': 'int', 'python': 'a = 5\nb = a', 'depends_on': ['a']},
+        'c': {'type': 'int', 'python': 'c = a', 'depends_on': ['a', 'b']},
+    })
+    symbols.resolve()
+    assert symbols() == {'a': 1, 'b': 5, 'c': 1}
+
+
+@pytest.mark.parametrize('symbols_text', [
+    pytest.param('symbols: {}', id='no-symbols'),
+    pytest.param('symbols:\n  a: {value: 1}', id='no-sweep'),
+    pytest.param('symbols:\n  a: {sweep: []}', id='empty-sweep'),
+    pytest.param('symbols:\n  a: {sweep: [1, 2, 3]}\n  b: {sweep: [1, 2]}', id='two-sweeps'),
+])
+def test_peek_sweep_size_matches_flatten(tmp_path, symbols_text):
+    fpath = tmp_path / 'card.yaml'
+    fpath.write_text(f'title: peek\n{symbols_text}\n')
+    symbol_specs = yaml.safe_load(symbols_text)['symbols']
+    expected = len(list(Symbols(symbol_specs).flatten()))
+    assert EvaluationCard.peek(fpath)['sweep_size'] == expected
@@ -19,6 +19,8 @@ def test_valid_card_passes_validation(simple_card):
 @pytest.mark.parametrize('broken_card', [
     pytest.param({'title': None}, id='null-required-field'),
     pytest.param({'claim': None}, id='missing-claim'),
+    pytest.param({'claim': {}}, id='empty-claim'),
+    pytest.param({'claim': {'python': 'assert x', 'expression': 'x'}}, id='ambiguous-claim'),
     pytest.param({'submitter': {'name': 'No Email'}}, id='invalid-nested-schema'),
     pytest.param({'symbols': None}, id='no-backend-or-symbols'),
     pytest.param({'symbols': {'x': {}}}, id='symbol-missing-resolution'),
@@ -27,3 +29,8 @@ def test_invalid_card_fails_validation(simple_card, broken_card):
     card = {**simple_card, **broken_card}
     with pytest.raises(ValidationError):
         EvaluationCardSchema.model_validate(card)
+
+
+def test_expression_claim_passes_validation(simple_card):
+    card = {**simple_card, 'claim': {'expression': 'x + 2 == 4'}}
+    EvaluationCardSchema.model_validate(card)
@@ -0,0 +1,39 @@
+import dataclasses
+from typing import List, Optional
+
+import dacite
+import pytest
+
+from magnet.utils.util_dataclass import dataclass_from_dict
+
+
+@dataclasses.dataclass(frozen=True)
+class Output:
+    text: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Reference:
+    output: Output
+    tags: List[str] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class Instance:
+    references: List[Reference]
+    main: Optional[Reference] = None
+
+
+@pytest.mark.parametrize('data', [
+    pytest.param({}, id='top-level'),
+    pytest.param({'references': [{}]}, id='nested-in-list'),
+    pytest.param({'references': [{'output': {}}]}, id='nested-twice'),
+    pytest.param({'references': [], 'main': {'output': {}}}, id='nested-optional'),
+])
+def test_missing_value_matches_dacite(data):
+    with pytest.raises(dacite.MissingValueError) as expected:
+        dacite.from_dict(Instance, data)
+    with pytest.raises(dacite.MissingValueError) as got:
+        dataclass_from_dict(Instance, data)
+    assert got.value.field_path == expected.value.field_path
+    assert str(got.value) == str(expected.value)